@@ -1,11 +1,12 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from credit_card_parser import CreditCardParser, StatementAnalyzer
-import pdfplumber
 import tempfile
 import os
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # ===== PAGE CONFIG =====
@@ -15,59 +16,214 @@ st.set_page_config(
     page_icon="💰"
 )
 
-# ===== CUSTOM STYLING =====
-st.markdown("""
-<style>
-.main {
-    background: linear-gradient(135deg, #f9f9f9 30%, #e1f0ff 100%);
-    font-family: 'Segoe UI', sans-serif;
-}
-[data-testid="stMetricValue"], [data-testid="stMetricLabel"] {color: black !important;}
-div[data-testid="stMetric"] {
-    background: white; padding: 15px; border-radius: 15px;
-    box-shadow: 0 2px 8px rgba(0,0,0,0.1); color: black !important;
-}
-section[data-testid="stFileUploader"] div div div div {display: none !important;}
-.upload-button {
-    display:inline-block; background:white; color:#0072ff; font-weight:600;
-    padding:10px 20px; border-radius:12px; border:2px solid #0072ff;
-    box-shadow:0 3px 8px rgba(0,0,0,0.1); cursor:pointer; transition:all .3s ease;
-}
-.upload-button:hover {background:#0072ff; color:white; transform:scale(1.03);}
-.stButton button, .stDownloadButton button {
-    background-color:#0072ff!important; color:white!important; border-radius:10px;
-    font-weight:600; padding:.6em 1.2em; border:none;
-}
-.stButton button:hover, .stDownloadButton button:hover {background-color:#005ce6!important;}
-.stDataFrame div {color:#000!important;}
-.warning-box {
-    background-color: #fff3cd; border: 1px solid #ffeaa7; border-radius: 10px;
-    padding: 15px; margin: 10px 0; color: #856404;
-}
-.scanned-warning {
-    background-color: #f8d7da; border: 1px solid #f5c6cb; border-radius: 10px;
-    padding: 15px; margin: 10px 0; color: #721c24;
-}
-.success-box {
-    background-color: #d4edda; border: 1px solid #c3e6cb; border-radius: 10px;
-    padding: 15px; margin: 10px 0; color: #155724;
-}
-.stTabs [data-baseweb="tab-list"] {
-    gap: 8px;
-}
-.stTabs [data-baseweb="tab"] {
-    background-color: white;
-    border-radius: 10px;
-    padding: 10px 20px;
-    color: #0072ff;
-    font-weight: 600;
-}
-.stTabs [aria-selected="true"] {
-    background-color: #0072ff;
-    color: white;
+# ===== CACHED HELPERS =====
+@st.cache_data(show_spinner=False)
+def parse_uploaded_statement(file_bytes: bytes, password: str = None):
+    """Parse the uploaded PDF once per (file, password); reruns hit the cache"""
+    parser = CreditCardParser(enable_ocr=True)
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tf:
+        tf.write(file_bytes)
+        path = tf.name
+    try:
+        if password:
+            data = parser.parse_statement(path, password=password)
+        else:
+            data = parser.parse_statement(path)
+        return data, parser._ocr_used
+    finally:
+        os.remove(path)
+
+
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "app.css")
+
+
+@st.cache_data(show_spinner=False)
+def load_css(path: str) -> str:
+    """Read the stylesheet from disk once; it is still emitted on every run since
+    Streamlit drops elements that a rerun does not re-render"""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@st.cache_resource(show_spinner=False)
+def check_ocr():
+    """Probe Tesseract once per server process instead of on every rerun"""
+    try:
+        import pytesseract
+        from PIL import Image
+        pytesseract.get_tesseract_version()
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+
+# ===== SPENDING CATEGORIES =====
+# Enhanced categorization based on actual transaction patterns
+CATEGORIES = {
+    'Shopping & E-commerce': [
+        'AMAZON', 'FLIPKART', 'MYNTRA', 'SHOP', 'MALL', 'STORE',
+        'PAYTM', 'DREAMPLUG', 'CLOTH', 'SILKS', 'READYM', 'COTTON',
+        'CLOTHINGS', 'GRASP', 'RAMRAJ', 'URVASI'
+    ],
+    'Food & Dining': [
+        'SWIGGY', 'ZOMATO', 'RESTAURANT', 'CAFE', 'FOOD', 'KITCHEN',
+        'FAMILY BAZAR'
+    ],
+    'Travel & Transportation': [
+        'UBER', 'OLA', 'IRCTC', 'AIRLINE', 'FLIGHT', 'HOTEL', 'RAILWAY',
+        'MAKEMYTRIP', 'BUS', 'TOLL', 'ELECTRONIC TOLL'
+    ],
+    'Fuel & Vehicle': [
+        'PETROL', 'DIESEL', 'FUEL', 'HP', 'SHELL', 'BPCL', 'HPCL',
+        'FILLING', 'SERVICE STAT', 'ENERGY STAT', 'PETROLEUM',
+        'AUTOMOBILES', 'ACCURATE FILLING', 'CHAKRA PETROL',
+        'ESSAR', 'MANAV SERVICE', 'AGARWAL', 'GREEN GAS'
+    ],
+    'Bills & Utilities': [
+        'ELECTRICITY', 'WATER', 'BROADBAND', 'MOBILE', 'RECHARGE',
+        'GAS', 'PHONEPE', 'BILLDESK', 'BILL PAYMENT', 'ONE97',
+        'MOBIKWIK'
+    ],
+    'Entertainment': [
+        'NETFLIX', 'PRIME', 'MOVIE', 'HOTSTAR', 'SPOTIFY', 'YOUTUBE',
+        'BIGTREE ENTERTAINMENT'
+    ],
+    'Insurance & Finance': [
+        'INSURANCE', 'SHRIRAM LIFE', 'EMI', 'LOAN'
+    ],
+    'Healthcare': [
+        'MEDICAL', 'HOSPITAL', 'PHARMACY', 'CLINIC', 'DOCTOR',
+        'SHALBY HOSPITALS', 'NURSING'
+    ],
+    'Fees & Charges': [
+        'FEE', 'CHARGE', 'OVERLIMIT', 'GST', 'INTEREST',
+        'SURCHARGE'
+    ],
+    'Other': []
 }
-</style>
-""", unsafe_allow_html=True)
+
+# Flat keyword -> category lookup; insertion order keeps category priority
+KEYWORD_TO_CATEGORY = {}
+for _cat, _keywords in CATEGORIES.items():
+    for _kw in _keywords:
+        KEYWORD_TO_CATEGORY.setdefault(_kw, _cat)
+CATEGORY_PRIORITY = {cat: i for i, cat in enumerate(CATEGORIES)}
+
+# Zero-width lookahead reports every keyword occurrence in a single scan,
+# including keywords that overlap (e.g. 'GAS' inside 'GREEN GAS')
+KEYWORD_SCAN_RE = re.compile('(?=(' + '|'.join(map(re.escape, KEYWORD_TO_CATEGORY)) + '))')
+
+
+def categorize(desc_upper: str) -> str:
+    """Highest-priority category among all keywords found in the description"""
+    hits = KEYWORD_SCAN_RE.findall(desc_upper)
+    if not hits:
+        return 'Other'
+    return min((KEYWORD_TO_CATEGORY[kw] for kw in hits), key=CATEGORY_PRIORITY.__getitem__)
+
+
+@st.cache_data(show_spinner=False)
+def categorize_descriptions(descriptions: tuple) -> list:
+    """Categorize each distinct description once; first matching category wins"""
+    lookup = {desc: categorize(desc.upper()) for desc in set(descriptions)}
+    return [lookup[desc] for desc in descriptions]
+
+
+@st.cache_data(show_spinner=False)
+def build_transactions_frame(transactions: tuple) -> pd.DataFrame:
+    """Build the transactions frame and the derived columns shared by the tabs"""
+    df = pd.DataFrame(list(transactions), columns=["date", "description", "amount"])
+    amt = df["amount"].to_numpy()
+    # Format amount with ₹ symbol: the sign/prefix choice is vectorized, while the
+    # thousands-separator formatting still runs once per element
+    magnitude = pd.Series(np.abs(amt), index=df.index).map('{:,.2f}'.format)
+    df["Formatted Amount"] = np.where(amt >= 0, "₹" + magnitude, "-₹" + magnitude)
+    df["type"] = np.where(amt < 0, 'Credit', 'Debit')
+    df.attrs["desc_upper"] = df["description"].str.upper().to_numpy(dtype=str)
+    # Parse dates once (cache=True dedupes repeated strings) so plotly gets a real
+    # datetime axis; fall back to the raw strings if any date fails to parse
+    parsed_dates = pd.to_datetime(df["date"], errors="coerce", dayfirst=True, cache=True)
+    df["txn_date"] = parsed_dates if parsed_dates.notna().all() else df["date"]
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def spending_by_category(transactions_df: pd.DataFrame) -> pd.Series:
+    """Debit totals per category, largest first"""
+    debits = transactions_df.loc[transactions_df['type'].eq('Debit'), ['category', 'amount']]
+    return debits.groupby('category', sort=False)['amount'].sum().sort_values(ascending=False)
+
+
+@st.cache_data(show_spinner=False)
+def build_spending_pie(spending: pd.Series):
+    """Pie chart of spending per category, cached so reruns skip figure construction"""
+    import plotly.express as px
+
+    fig = px.pie(values=spending.values, names=spending.index,
+                 title='Spending Distribution',
+                 color_discrete_sequence=px.colors.qualitative.Set3)
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def build_timeline_figure(transactions_df: pd.DataFrame):
+    """Scatter timeline of debits and credits, cached on the transactions frame"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+
+    # Debit and credit partition the frame, so one groupby yields both traces
+    trace_colors = {'Debit': 'red', 'Credit': 'green'}
+    for tx_type, group in transactions_df.groupby('type', sort=False):
+        fig.add_trace(go.Scatter(
+            x=group['txn_date'],
+            y=group['amount'].abs(),
+            mode='markers',
+            name=tx_type,
+            marker=dict(size=10, color=trace_colors[tx_type], opacity=0.6),
+            text=group['description'],
+            hovertemplate='<b>%{text}</b><br>Date: %{x}<br>Amount: ₹%{y:,.2f}<extra></extra>'
+        ))
+
+    fig.update_layout(
+        title='Transaction Timeline',
+        xaxis_title='Date',
+        yaxis_title='Amount (₹)',
+        hovermode='closest',
+        height=500
+    )
+    return fig
+
+
+def _write_csv_sections(*sections) -> bytes:
+    """Encode CSV text straight into a bytes buffer, skipping the intermediate str"""
+    buf = io.BytesIO()
+    writer = io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True)
+    for section in sections:
+        if isinstance(section, str):
+            writer.write(section)
+        else:
+            section.to_csv(writer, index=False)
+    writer.flush()
+    writer.detach()  # keep buf open once the wrapper is garbage-collected
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def make_full_csv(summary_df: pd.DataFrame, transactions_df: pd.DataFrame) -> bytes:
+    """Write the summary and transactions sections back to back into one CSV"""
+    return _write_csv_sections(summary_df, "---TRANSACTIONS---\n", transactions_df)
+
+
+@st.cache_data(show_spinner=False)
+def make_transactions_csv(transactions_df: pd.DataFrame) -> bytes:
+    """Transactions-only export"""
+    return _write_csv_sections(transactions_df)
+
+
+# ===== CUSTOM STYLING =====
+st.markdown(f"<style>{load_css(CSS_PATH)}</style>", unsafe_allow_html=True)
 
 # ===== TITLE =====
 st.title("💳 Multi-Bank Credit Card Statement Analyzer")
@@ -79,25 +235,33 @@ uploaded_file = st.file_uploader("", type=["pdf"], label_visibility="collapsed")
 
 # ===== PROCESS FILE =====
 if uploaded_file:
-    # Save temp file
-    temp_path = "temp.pdf"
-    with open(temp_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    # Read the upload once; encryption check and parsing share this buffer
+    file_bytes = uploaded_file.getvalue()
 
-    # Initialize parser with OCR enabled
-    parser = CreditCardParser(enable_ocr=True)
+    # Check if PDF is encrypted using PyPDF2/pypdf (same method as parser)
+    is_encrypted = False
+    password = None
     
-    # Check OCR availability and show status
-    ocr_available = False
     try:
-        import pytesseract
-        from PIL import Image
-        pytesseract.get_tesseract_version()
-        ocr_available = True
+        from pypdf import PdfReader
+    except ImportError:
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            st.error("❌ PyPDF2 or pypdf library not found. Please install it: pip install pypdf")
+            st.stop()
+    
+    # The encryption check runs on a worker thread while the OCR probe runs here;
+    # Streamlit calls stay on the script thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        encryption_check = executor.submit(lambda: PdfReader(io.BytesIO(file_bytes)).is_encrypted)
+        ocr_available, ocr_error = check_ocr()
+
+    # Show OCR status
+    if ocr_available:
         st.success("🔍 OCR Available - Scanned PDFs can be processed")
-    except Exception as ocr_error:
-        ocr_available = False
-        error_str = str(ocr_error).lower()
+    else:
+        error_str = ocr_error.lower()
         if "tesseract" in error_str or "not installed" in error_str:
             st.warning("⚠️ Tesseract OCR Not Installed - Scanned PDFs cannot be processed")
             with st.expander("📖 How to Install Tesseract OCR"):
@@ -122,31 +286,12 @@ if uploaded_file:
                 After installation, restart the Streamlit app.
                 """)
         else:
-            st.info(f"ℹ️ OCR Status: {str(ocr_error)}")
-    
-    # Check if PDF is encrypted using PyPDF2/pypdf (same method as parser)
-    is_encrypted = False
-    password = None
+            st.info(f"ℹ️ OCR Status: {ocr_error}")
     
     try:
-        from pypdf import PdfReader
-    except ImportError:
-        try:
-            from PyPDF2 import PdfReader
-        except ImportError:
-            st.error("❌ PyPDF2 or pypdf library not found. Please install it: pip install pypdf")
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-            st.stop()
-    
-    try:
-        with open(temp_path, 'rb') as file:
-            reader = PdfReader(file)
-            is_encrypted = reader.is_encrypted
+        is_encrypted = encryption_check.result()
     except Exception as e:
         st.error(f"❌ Error reading PDF: {str(e)}")
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
         st.stop()
 
     # Handle encrypted PDFs
@@ -163,14 +308,11 @@ if uploaded_file:
         status_container = st.empty()
         
         with st.spinner("🔎 Analyzing your statement... Please wait..."):
-            # Pass password only if it exists and is not empty
-            if password:
-                data = parser.parse_statement(temp_path, password=password)
-            else:
-                data = parser.parse_statement(temp_path)
+            # Cached on file contents + password, so filter/tab reruns skip PDF work
+            data, ocr_used = parse_uploaded_statement(file_bytes, password or None)
         
         # Show OCR success message if OCR was used
-        if hasattr(parser, '_ocr_used') and parser._ocr_used:
+        if ocr_used:
             st.markdown("""
             <div class="success-box">
             <strong>✅ Scanned PDF Processed Successfully</strong><br>
@@ -229,27 +371,23 @@ if uploaded_file:
         if data.transactions:
             st.markdown("### 💳 Transactions Analysis")
             
-            # Create transactions dataframe
-            transactions_df = pd.DataFrame(data.transactions)
-            
-            # Format amount with ₹ symbol and proper formatting
-            def format_amount(amount):
-                if amount >= 0:
-                    return f"₹{amount:,.2f}"
-                else:
-                    return f"-₹{abs(amount):,.2f}"
-            
-            transactions_df["Formatted Amount"] = transactions_df["amount"].apply(format_amount)
-            transactions_df['type'] = transactions_df['amount'].apply(lambda x: 'Credit' if x < 0 else 'Debit')
+            # Create transactions dataframe (shared by every tab, cached across reruns)
+            transactions_df = build_transactions_frame(
+                tuple((t['date'], t['description'], t['amount']) for t in data.transactions)
+            )
             
             # Display summary statistics
             st.markdown("#### 📈 Transaction Summary")
             col1, col2, col3, col4 = st.columns(4)
             
-            total_spent = transactions_df[transactions_df["amount"] > 0]["amount"].sum()
-            total_credits = transactions_df[transactions_df["amount"] < 0]["amount"].sum()
+            # Single pass over the amounts, one row per transaction type
+            type_totals = transactions_df.groupby('type', sort=False)['amount'].sum()
+            total_spent = type_totals.get('Debit', 0.0)
+            total_credits = type_totals.get('Credit', 0.0)
             transaction_count = len(transactions_df)
-            avg_transaction = transactions_df[transactions_df["amount"] > 0]["amount"].mean() if len(transactions_df[transactions_df["amount"] > 0]) > 0 else 0
+            # Average over amounts > 0 only; the Debit group also holds 0.00 entries
+            spent_count = transactions_df['amount'].gt(0).sum()
+            avg_transaction = total_spent / spent_count if spent_count > 0 else 0
             
             with col1:
                 st.metric("💸 Total Spent", f"₹{total_spent:,.2f}")
@@ -279,20 +417,22 @@ if uploaded_file:
                     search_term = st.text_input("Search in descriptions:", "")
                 
                 # Apply filters
-                display_df = transactions_df[["date", "description", "Formatted Amount", "type"]].copy()
+                display_df = transactions_df[["date", "description", "amount", "type"]].copy()
                 display_df.columns = ["Date", "Description", "Amount", "Type"]
                 
                 filtered_df = display_df[display_df['Type'].isin(filter_type)]
                 
                 if search_term:
-                    filtered_df = filtered_df[
-                        filtered_df["Description"].str.contains(search_term, case=False, na=False)
-                    ]
+                    # Plain substring search over the descriptions upper-cased in the builder
+                    matches = np.char.find(transactions_df.attrs["desc_upper"], search_term.upper()) >= 0
+                    filtered_df = filtered_df[matches[filtered_df.index]]
                     st.write(f"Found {len(filtered_df)} transactions matching '{search_term}'")
                 
                 # Display transactions table
+                # Amount stays float64; the browser formats it from the Arrow payload
                 st.dataframe(
                     filtered_df[["Date", "Description", "Amount"]],
+                    column_config={"Amount": st.column_config.NumberColumn("Amount", format="₹%.2f")},
                     use_container_width=True,
                     height=400
                 )
@@ -300,77 +440,25 @@ if uploaded_file:
             with tab2:
                 st.markdown("#### 📊 Spending by Category")
                 
-                # Enhanced categorization based on actual transaction patterns
-                categories = {
-                    'Shopping & E-commerce': [
-                        'AMAZON', 'FLIPKART', 'MYNTRA', 'SHOP', 'MALL', 'STORE', 
-                        'PAYTM', 'DREAMPLUG', 'CLOTH', 'SILKS', 'READYM', 'COTTON',
-                        'CLOTHINGS', 'GRASP', 'RAMRAJ', 'URVASI'
-                    ],
-                    'Food & Dining': [
-                        'SWIGGY', 'ZOMATO', 'RESTAURANT', 'CAFE', 'FOOD', 'KITCHEN',
-                        'FAMILY BAZAR'
-                    ],
-                    'Travel & Transportation': [
-                        'UBER', 'OLA', 'IRCTC', 'AIRLINE', 'FLIGHT', 'HOTEL', 'RAILWAY',
-                        'MAKEMYTRIP', 'BUS', 'TOLL', 'ELECTRONIC TOLL'
-                    ],
-                    'Fuel & Vehicle': [
-                        'PETROL', 'DIESEL', 'FUEL', 'HP', 'SHELL', 'BPCL', 'HPCL',
-                        'FILLING', 'SERVICE STAT', 'ENERGY STAT', 'PETROLEUM',
-                        'AUTOMOBILES', 'ACCURATE FILLING', 'CHAKRA PETROL',
-                        'ESSAR', 'MANAV SERVICE', 'AGARWAL', 'GREEN GAS'
-                    ],
-                    'Bills & Utilities': [
-                        'ELECTRICITY', 'WATER', 'BROADBAND', 'MOBILE', 'RECHARGE',
-                        'GAS', 'PHONEPE', 'BILLDESK', 'BILL PAYMENT', 'ONE97',
-                        'MOBIKWIK'
-                    ],
-                    'Entertainment': [
-                        'NETFLIX', 'PRIME', 'MOVIE', 'HOTSTAR', 'SPOTIFY', 'YOUTUBE',
-                        'BIGTREE ENTERTAINMENT'
-                    ],
-                    'Insurance & Finance': [
-                        'INSURANCE', 'SHRIRAM LIFE', 'EMI', 'LOAN'
-                    ],
-                    'Healthcare': [
-                        'MEDICAL', 'HOSPITAL', 'PHARMACY', 'CLINIC', 'DOCTOR',
-                        'SHALBY HOSPITALS', 'NURSING'
-                    ],
-                    'Fees & Charges': [
-                        'FEE', 'CHARGE', 'OVERLIMIT', 'GST', 'INTEREST',
-                        'SURCHARGE'
-                    ],
-                    'Other': []
-                }
-                
-                def categorize(desc):
-                    desc_upper = desc.upper()
-                    for cat, keywords in categories.items():
-                        if any(kw in desc_upper for kw in keywords):
-                            return cat
-                    return 'Other'
-                
-                transactions_df['category'] = transactions_df['description'].apply(categorize)
+                # Categories are only used by this tab, so derive them here
+                if 'category' not in transactions_df:
+                    transactions_df['category'] = categorize_descriptions(tuple(transactions_df['description']))
                 
                 # Only include debits for spending analysis
-                spending_df = transactions_df[transactions_df['type'] == 'Debit'].groupby('category')['amount'].sum().reset_index()
-                spending_df = spending_df.sort_values('amount', ascending=False)
+                spending = spending_by_category(transactions_df)
                 
-                if len(spending_df) > 0:
+                if len(spending) > 0:
                     col1, col2 = st.columns([2, 1])
                     
                     with col1:
-                        fig = px.pie(spending_df, values='amount', names='category', 
-                                     title='Spending Distribution',
-                                     color_discrete_sequence=px.colors.qualitative.Set3)
-                        fig.update_traces(textposition='inside', textinfo='percent+label')
+                        fig = build_spending_pie(spending)
                         st.plotly_chart(fig, use_container_width=True)
                     
                     with col2:
                         st.markdown("##### Top Categories")
-                        for idx, row in spending_df.head(5).iterrows():
-                            st.write(f"**{row['category']}:** ₹{row['amount']:,.2f}")
+                        top = spending.head(5)
+                        for category, amount in zip(top.index, top.to_numpy()):
+                            st.write(f"**{category}:** ₹{amount:,.2f}")
                 else:
                     st.info("No spending data available to visualize")
             
@@ -378,42 +466,7 @@ if uploaded_file:
                 st.markdown("#### 📈 Transaction Timeline")
                 
                 if len(transactions_df) > 0:
-                    fig = go.Figure()
-                    
-                    # Add debit transactions
-                    debit_df = transactions_df[transactions_df['type'] == 'Debit']
-                    if len(debit_df) > 0:
-                        fig.add_trace(go.Scatter(
-                            x=debit_df['date'],
-                            y=debit_df['amount'],
-                            mode='markers',
-                            name='Debit',
-                            marker=dict(size=10, color='red', opacity=0.6),
-                            text=debit_df['description'],
-                            hovertemplate='<b>%{text}</b><br>Date: %{x}<br>Amount: ₹%{y:,.2f}<extra></extra>'
-                        ))
-                    
-                    # Add credit transactions
-                    credit_df = transactions_df[transactions_df['type'] == 'Credit']
-                    if len(credit_df) > 0:
-                        fig.add_trace(go.Scatter(
-                            x=credit_df['date'],
-                            y=credit_df['amount'].abs(),
-                            mode='markers',
-                            name='Credit',
-                            marker=dict(size=10, color='green', opacity=0.6),
-                            text=credit_df['description'],
-                            hovertemplate='<b>%{text}</b><br>Date: %{x}<br>Amount: ₹%{y:,.2f}<extra></extra>'
-                        ))
-                    
-                    fig.update_layout(
-                        title='Transaction Timeline',
-                        xaxis_title='Date',
-                        yaxis_title='Amount (₹)',
-                        hovermode='closest',
-                        height=500
-                    )
-                    
+                    fig = build_timeline_figure(transactions_df)
                     st.plotly_chart(fig, use_container_width=True)
                 else:
                     st.info("No timeline data to visualize")
@@ -440,24 +493,14 @@ if uploaded_file:
                 summary_df = pd.DataFrame(summary_data)
                 
                 # Transactions section
-                transactions_export_df = pd.DataFrame(data.transactions)
-                transactions_export_df["Formatted Amount"] = transactions_export_df["amount"].apply(
-                    lambda x: f"₹{x:,.2f}" if x >= 0 else f"-₹{abs(x):,.2f}"
-                )
-                transactions_export_df = transactions_export_df[["date", "description", "Formatted Amount", "amount"]]
+                transactions_export_df = transactions_df[["date", "description", "Formatted Amount", "amount"]].copy()
                 transactions_export_df.columns = ["Date", "Description", "Formatted Amount", "Numeric Amount"]
                 
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     # Combine for download
-                    combined_data = pd.concat([
-                        summary_df, 
-                        pd.DataFrame([{"Field": "---TRANSACTIONS---", "Value": ""}]),
-                        transactions_export_df
-                    ], ignore_index=True)
-                    
-                    csv_data = combined_data.to_csv(index=False).encode("utf-8")
+                    csv_data = make_full_csv(summary_df, transactions_export_df)
                     
                     st.download_button(
                         "📥 Download Full Statement (CSV)",
@@ -470,7 +513,7 @@ if uploaded_file:
                 
                 with col2:
                     # Quick transactions-only download
-                    transactions_csv = transactions_export_df[["Date", "Description", "Formatted Amount"]].to_csv(index=False).encode("utf-8")
+                    transactions_csv = make_transactions_csv(transactions_export_df[["Date", "Description", "Formatted Amount"]])
                     st.download_button(
                         "📥 Download Transactions Only (CSV)",
                         transactions_csv,
@@ -595,11 +638,6 @@ if uploaded_file:
             st.write("- For encrypted PDFs, make sure you entered the correct password")
             st.write("- Try with a different statement if available")
 
-    finally:
-        # Clean up temporary file
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-
 else:
     # Show instructions when no file is uploaded
     st.info("👆 Upload your PDF credit card statement to get started.")
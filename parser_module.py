@@ -1,10 +1,16 @@
 import pdfplumber
 import re
-import pandas as pd
-from typing import Dict, List
-from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Iterator, List, Union
+from dataclasses import dataclass, replace
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+import hashlib
+import importlib.util
+import io
 import os
-import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Import PyPDF2/pypdf for encryption handling
 try:
@@ -17,23 +23,347 @@ except ImportError:
     except ImportError:
         raise ImportError("Neither pypdf nor PyPDF2 is installed. Install with: pip install pypdf")
 
-# Import OCR libraries (optional)
+# Import OCR libraries (optional). Pages are rendered to PIL images, which either engine can read.
 try:
-    import pytesseract
     from PIL import Image
-    OCR_AVAILABLE = True
 except ImportError:
-    pytesseract = None
     Image = None
-    OCR_AVAILABLE = False
 
-pd.set_option('display.max_columns', None)
-pd.set_option('display.width', 120)
-pd.set_option('display.max_colwidth', 200)
-pd.set_option('display.max_rows', None)
+try:
+    import pytesseract
+    PYTESSERACT_AVAILABLE = True
+except ImportError:
+    pytesseract = None
+    PYTESSERACT_AVAILABLE = False
+
+# tesserocr keeps the Tesseract engine loaded in-process (optional, preferred over pytesseract).
+# It is imported on first OCR use rather than here: OpenMP reads OMP_THREAD_LIMIT when tesserocr
+# loads it, so a batch worker can still set the limit first (see _init_worker).
+TESSEROCR_AVAILABLE = importlib.util.find_spec('tesserocr') is not None
+
+
+@lru_cache(maxsize=1)
+def _load_tesserocr():
+    """The tesserocr module, or None when it is installed but can't be loaded"""
+    try:
+        import tesserocr
+    except ImportError:
+        return None
+    return tesserocr
+
+
+OCR_AVAILABLE = Image is not None and (TESSEROCR_AVAILABLE or PYTESSERACT_AVAILABLE)
+
+# xxhash gives compact integer dedup keys for transactions (optional)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
+
+# OCR settings. Statements are clean printed text, so 200 DPI with the LSTM engine
+# (--oem 1) is enough; point TESSDATA_PREFIX at tessdata_fast for the quicker models.
+# Pages that come back (nearly) empty are retried once at OCR_FALLBACK_RESOLUTION.
+# Pages are OCR'd on several threads, so Tesseract itself should run with OMP_THREAD_LIMIT=1.
+# Batch workers set that themselves; other deployments set it in their environment.
+OCR_RESOLUTION = 200
+OCR_FALLBACK_RESOLUTION = 300
+OCR_MIN_PAGE_CHARS = 20
+OCR_CONFIG = '--psm 6 --oem 1'
+
+# Parsed statements kept per parser by parse_statement_cached
+PARSE_CACHE_SIZE = 64
+# Extraction results kept per parser, keyed on a digest of the statement text
+TEXT_CACHE_SIZE = 128
+
+
+# ========== PRECOMPILED PATTERNS ==========
+# Compiled once at import so the extractors skip the re module's cache lookup
+
+# Shared
+_CORRUPT_ERROR_RE = re.compile(r'corrupt|cannot read|invalid|malformed|decrypt', re.IGNORECASE)
+_ENCRYPTED_ERROR_RE = re.compile(r'encrypted|password', re.IGNORECASE)
+_TRAILING_NON_ALPHA_RE = re.compile(r'[^A-Za-z\s]+$')
+_LONG_DATE_RE = re.compile(r'([A-Z][a-z]+\s+\d{1,2},\s+\d{4})')
+_AMOUNT_TOKEN_RE = re.compile(r'[`₹]?\s*([\d,]+\.?\d*)')
+# Strips thousands separators, rupee marks and spaces from an amount in one pass
+_AMT_TRANS = str.maketrans('', '', ",`₹ ")
+# A non-empty line, using the same line boundaries as str.splitlines()
+_LINE_RE = re.compile(r'[^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]+')
+
+# HDFC
+_HDFC_NAME_RE = re.compile(r'Name\s*:\s*([A-Z][A-Za-z\s]+?)(?:\n|Email)', re.IGNORECASE)
+_HDFC_NAME_BEFORE_000_RE = re.compile(r'Name\s*:\s*([A-Z\s]+)\s*\n\s*000')
+_HDFC_NAME_TX_HEADER_RE = re.compile(
+    r'Domestic Transactions\s+Date\s+Transaction Description\s+Amount.*?\n\s*([A-Z][A-Z\s]+[A-Z])\s*\n\s*\d{2}/\d{2}/\d{4}',
+    re.DOTALL
+)
+# Words that show the line under the transaction header is a merchant or heading, not a name
+_HDFC_NAME_SKIP = ('PAYTM', 'TRANSACTION', 'AMOUNT', 'DATE', 'NOIDA', 'DELHI')
+_HDFC_CARD_NO_RE = re.compile(r'Card No:\s*\d{4}\s*\d{2}XX\s*XXXX\s*(\d{4})')
+_HDFC_MASKED_CARD_RE = re.compile(r'\d{4}\s+\d{2}X+\s+X+\s+(\d{4})')
+_HDFC_STATEMENT_DATE_RE = re.compile(r'Statement Date:\s*(\d{2}/\d{2}/\d{4})')
+_HDFC_DUE_DATE_RE = re.compile(r'Payment Due Date\s+Total Dues.*?\n(\d{2}/\d{2}/\d{4})', re.DOTALL)
+# Due date, total dues and minimum due printed on one row
+_HDFC_DUES_ROW_RE = re.compile(r'(\d{2}/\d{2}/\d{4})\s+([\d,]+\.[\d]{2})\s+([\d,]+\.[\d]{2})')
+_HDFC_TOTAL_DUES_RE = re.compile(r'Total Dues[^\d]+([\d,]+\.[\d]{2})')
+_HDFC_MIN_DUE_RE = re.compile(r'Minimum Amount Due[^\d]+([\d,]+\.[\d]{2})')
+_CREDIT_LIMIT_LABEL_RE = re.compile(r'Credit Limit', re.IGNORECASE)
+_HDFC_CREDIT_LIMIT_TABLE_RE = re.compile(
+    r'Credit Limit\s+Available Credit Limit\s+Available Cash Limit\s*\n\s*([\d,]+)', re.IGNORECASE
+)
+_HDFC_CREDIT_LIMIT_PIPE_RE = re.compile(r'Credit Limit\s*\|\s*([\d,]+)', re.IGNORECASE)
+_HDFC_CREDIT_LIMIT_INLINE_RE = re.compile(r'Credit Limit[^\d\n]*([\d,]+)', re.IGNORECASE)
+_HDFC_AVAILABLE_TABLE_RE = re.compile(
+    r'Credit Limit\s+Available Credit Limit\s+Available Cash Limit\s*\n\s*([\d,]+)(?:\.[\d]+)?\s+([\d,]+\.[\d]+)',
+    re.IGNORECASE
+)
+_HDFC_AVAILABLE_BLOCK_RE = re.compile(
+    r'Credit Limit\s+Available Credit Limit.*?\n\s*[\d,]+(?:\.\d+)?\s+([\d,]+\.\d+)', re.IGNORECASE | re.DOTALL
+)
+_HDFC_AVAILABLE_PIPE_RE = re.compile(r'Available Credit Limit\s*\|\s*([\d,]+\.?\d*)', re.IGNORECASE)
+_HDFC_DOMESTIC_SECTION_RE = re.compile(
+    r'Domestic Transactions\s+Date\s+Transaction Description\s+Amount.*?(?=Reward Points|$)', re.DOTALL
+)
+# One transaction per line; [^\S\n] keeps every gap on the same line and the description
+# is capped at 200 characters, which bounds how far the lazy match can backtrack
+_HDFC_TX_RE = re.compile(
+    r'^[^\S\n]*(\d{2}/\d{2}/\d{4})[^\S\n]+(.{1,200}?)[^\S\n]+([\d,]+\.\d{2})([^\S\n]+Cr)?[^\S\n]*$',
+    re.MULTILINE
+)
+
+# ICICI
+_ICICI_NAME_RE = re.compile(
+    r'((?:MR|MS|MRS|DR)\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*\n\s*(?:AT/PO|FLAT|HOUSE|[A-Z\s,/]+\n)'
+)
+_ICICI_CARD_RE = re.compile(r'\d{4}X+(\d{4})')
+_ICICI_STATEMENT_DATE_RE = re.compile(
+    r'STATEMENT DATE.*?([A-Z][a-z]+\s+\d{1,2},\s+\d{4})', re.IGNORECASE | re.DOTALL
+)
+_ICICI_STATEMENT_PERIOD_RE = re.compile(
+    r'Statement period\s*:\s*[A-Za-z]+\s+\d{1,2},\s+\d{4}\s+to\s+([A-Z][a-z]+\s+\d{1,2},\s+\d{4})'
+)
+_ICICI_DUE_DATE_RE = re.compile(
+    r'PAYMENT DUE DATE.*?([A-Z][a-z]+\s+\d{1,2},\s+\d{4})', re.IGNORECASE | re.DOTALL
+)
+_ICICI_TOTAL_DUE_RE = re.compile(r'Total Amount due\s+[`₹]?\s*([\d,]+\.?\d*)', re.IGNORECASE)
+_ICICI_TOTAL_DUE_LOOSE_RE = re.compile(r'Total\s+Amount\s+due\s*[`₹]?\s*([\d,]+\.?\d*)', re.IGNORECASE)
+_ICICI_MIN_DUE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Minimum\s+Amount\s+due\s*[:\-]?\s*[`₹]?\s*([\d,]+\.?\d*)',
+    r'Minimum\s+Amount\s*[:\-]?\s*[`₹]?\s*([\d,]+\.?\d*)',
+    r'Minimum\s+Amount\s+Payable\s*[:\-]?\s*[`₹]?\s*([\d,]+\.?\d*)',
+    r'Amount\s+Due\s+\(Minimum\)\s*[`₹]?\s*([\d,]+\.?\d*)',
+))
+_ICICI_MIN_DUE_LABEL_RE = re.compile(r'Minimum\s+Amount\s+due', re.IGNORECASE)
+_MIN_DUE_LINE_RE = re.compile(r'MINIMUM|MIN DUE', re.IGNORECASE)
+_ICICI_CREDIT_LIMIT_RE = re.compile(
+    r"Credit Limit \(Including cash\)\s+Available Credit.*?[`₹]\s*([\d,]+\.?\d*)",
+    re.IGNORECASE | re.DOTALL
+)
+_ICICI_AVAILABLE_CREDIT_RE = re.compile(
+    r"Credit Limit \(Including cash\)\s+Available Credit \(Including cash\).*?[`₹]\s*[\d,]+\.?\d*\s+[`₹]\s*([\d,]+\.?\d*)",
+    re.IGNORECASE | re.DOTALL
+)
+# Column headers and section titles that the row pattern can pick up as descriptions
+_ICICI_HEADER_RE = re.compile(r'TRANSACTION DETAILS|DATE|SERNO|AMOUNT|INTL|STATEMENT', re.IGNORECASE)
+_ICICI_TX_RE = re.compile(
+    r'(\d{2}/\d{2}/\d{4})\s+'  # Date
+    r'(\d+)\s+'  # Serial number
+    r'(.+?)\s+'  # Description
+    r'(?:IN\s+)?'  # Optional "IN"
+    r'([\d,]+\.?\d*)\s*'  # Amount
+    r'(CR)?'  # Optional CR
+    r'(?:\s*$)',  # End of line
+    re.MULTILINE
+)
+
+# Axis / IDFC First shared
+_STAR_CARD_RE = re.compile(r'(\d{6}\*{6}(\d{4}))|(\*{6}(\d{4}))')
+_FOUR_DIGITS_RE = re.compile(r'\d{4}')
+_SLASH_DATE_RE = re.compile(r'(\d{2}/\d{2}/\d{4})')
+
+# Axis
+_AXIS_NAME_RE = re.compile(r'\n([A-Z][A-Z\s,.-]+)\nB/')
+# Uppercase lines containing any of these are headings, not the cardholder's name
+_AXIS_NAME_SKIP_RE = re.compile(r'AXIS|STATEMENT|PAYMENT|SUMMARY')
+_AXIS_DR_AMOUNT_RE = re.compile(r'([\d\s,]+\.\d{2})\s*Dr', re.IGNORECASE)
+_AXIS_LIMITS_RE = re.compile(r'\*{4,}\d{4}\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})')
+_AXIS_PAY_START_RE = re.compile(r'PAYMENT SUMMARY', re.IGNORECASE)
+_AXIS_PAY_END_RE = re.compile(r'AUTO-DEBIT', re.IGNORECASE)
+_NON_NUMERIC_RE = re.compile(r'[^\d.\-]')
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+# Descriptions are capped at 200 characters, as for HDFC
+_AXIS_TX_RE = re.compile(
+    r'(\d{2}/\d{2}/\d{4})\s+(.{1,200}?)\s+([\d\s,]+\.\d{2})\s*(Dr|Cr)\b',
+    re.MULTILINE | re.IGNORECASE
+)
+# Either a line that opens with a date, or an amount with its Dr/Cr marker; never crosses a line
+_AXIS_LINE_SCAN_RE = re.compile(
+    r'^[^\S\n]*(?P<date>\d{2}/\d{2}/\d{4})|(?P<amount>(?:[\d,]|[^\S\n])+\.\d{2})[^\S\n]*(?P<drcr>Dr|Cr)\b',
+    re.MULTILINE | re.IGNORECASE
+)
+# Case-sensitive on purpose: only "Dr"/"Cr" suffixes are stripped from the description
+_AXIS_AMOUNT_DRCR_STRIP_RE = re.compile(r'([\d\s,]+\.\d{2})\s*(Dr|Cr)\b')
+
+# IDFC First
+_IDFC_NAME_HEADER_RE = re.compile(
+    r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*\n\s*Credit Card Statement', re.MULTILINE
+)
+_IDFC_CUSTOMER_NAME_RE = re.compile(r'Customer Name\s*:\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)')
+_IDFC_CARD_NUMBER_TAIL_RE = re.compile(r'\s+Card\s+Number.*$', re.IGNORECASE)
+_IDFC_NAME_BEFORE_STATEMENT_RE = re.compile(
+    r'\n([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+){1,3})\s*\n.*?Credit Card Statement', re.DOTALL
+)
+_IDFC_CARD_NUMBER_RE = re.compile(r'Card Number\s*:?\s*\d+\*+(\d{4})')
+_IDFC_NAME_SKIP_RE = re.compile(r'ALWAYS|FIRST|BANK|STATEMENT|CARD NUMBER')
+# The dates, dues and limits patterns below run against the lowercased statement text
+# (see _parse_idfc), so they are written in lowercase and skip re.IGNORECASE
+_IDFC_DATES_RE = re.compile(r'statement\s+date\s*\n\s*(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})')
+# Labelled statement and due dates, found together in one scan
+_IDFC_LABELLED_DATES_RE = re.compile(
+    r'statement\s+date\s*\n\s*(?P<statement>\d{2}/\d{2}/\d{4})'
+    r'|payment\s+due\s+date\s*\n\s*(?P<due>\d{2}/\d{2}/\d{4})'
+)
+_DATE_PAIR_RE = re.compile(r'(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})')
+_IDFC_DUES_TABLE_RE = re.compile(
+    r'total\s+amount\s+due\s+minimum\s+amount\s+due\s*\n\s*r?\s*([\d,]+\.?\d*)\s+r?\s*([\d,]+\.?\d*)'
+)
+# Dues block: the labels are located first, then the amounts are matched in a short
+# window after "minimum amount due" rather than across the rest of the document
+_IDFC_TOTAL_DUE_LABEL_RE = re.compile(r'total\s+amount\s+due')
+_IDFC_MIN_DUE_LABEL_RE = re.compile(r'minimum\s+amount\s+due')
+_IDFC_DUES_WINDOW_RE = re.compile(r'.*?\n.*?[r₹]\s*([\d,]+\.?\d*).*?[r₹]\s*([\d,]+\.?\d*)', re.DOTALL)
+_IDFC_DUES_WINDOW = 400
+# Separately labelled total and minimum due, found together in one scan
+_IDFC_LABELLED_DUES_RE = re.compile(
+    r'total\s+amount\s+due\s*:?\s*[r₹]?\s*(?P<total>[\d,]+\.?\d*)'
+    r'|minimum\s+amount\s+due\s*:?\s*[r₹]?\s*(?P<minimum>[\d,]+\.?\d*)'
+)
+_IDFC_LIMITS_BLOCK_RE = re.compile(
+    r'credit\s+limit\s+available\s+credit\s+limit.*?cash\s+limit', re.DOTALL
+)
+# IDFC's PDFs render the rupee sign as a literal "r"
+_IDFC_RUPEE_AMOUNT_RE = re.compile(r'r\s*([\d,]+(?:\.\d+)?)')
+_IDFC_LINE_AMOUNT_RE = re.compile(r'r?\s*([\d,]+(?:\.\d+)?)')
+_IDFC_CREDIT_SECTION_RE = re.compile(r'credit\s+limit.*?(?:available|cash|\n\n)', re.DOTALL)
+_IDFC_AVAIL_SECTION_RE = re.compile(r'available\s+credit\s+limit.*?(?:cash|\n\n)', re.DOTALL)
+_IDFC_CASH_SECTION_RE = re.compile(r'cash\s+limit.*?(?:\n\n|statement)', re.DOTALL)
+_IDFC_SECTION_AMOUNT_RE = re.compile(r'(?:r|₹)?\s*([\d,]+(?:\.\d+)?)')
+# Transactions run from this header to the first end marker (or the end of the text)
+_IDFC_TX_HEADER_RE = re.compile(r'YOUR\s+TRANSACTIONS', re.IGNORECASE)
+_IDFC_TX_END_RE = re.compile(r'KEY\s+OFFERS|Page\s+\d+', re.IGNORECASE)
+# Descriptions are capped at 200 characters, as for HDFC
+_IDFC_TX_RE = re.compile(
+    r'(\d{2}/\d{2}/\d{4})\s+(.{1,200}?)\s+([\d,]+\.?\d*)\s*(CR)?(?:\s*\n|$)',
+    re.MULTILINE | re.IGNORECASE
+)
+# Header words that mark a matched row as part of the table heading, not a transaction
+_IDFC_SKIP_RE = re.compile(r'TRANSACTION|DATE|DETAILS|AMOUNT|CUSTOMER NAME|CARD NUMBER')
+
+# Indian Bank
+_INDIAN_NAME_RE = re.compile(r'Mr\.?\s+([A-Z][A-Za-z\s]+)')
+_INDIAN_CARD_RE = re.compile(r'(\d{4})\s*\d{2}XX\s*XXXX\s*(\d{4})')
+_INDIAN_CARD_TAIL_RE = re.compile(r'XXXX\s*(\d{4})')
+_INDIAN_DATES_RE = re.compile(
+    r'(\d{2}-\d{2}-\d{2})\s+(\d{2}-\d{2}-\d{2})\s*-\s*(\d{2}-\d{2}-\d{2})\s+(\d{2}-\d{2}-\d{2})'
+)
+_INDIAN_DUES_RE = re.compile(r'\d{4}\s+\d{2}XX\s+XXXX\s+\d{4}.*?\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})')
+_AMOUNT_PAIR_RE = re.compile(r'([\d,]+\.\d{2})\s+([\d,]+\.\d{2})')
+_INDIAN_LIMITS_RE = re.compile(r'([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})')
+_INDIAN_TX_SECTION_RE = re.compile(
+    r'Txn\.\s*Date\s*Transaction Particulars.*?(?=CONTACT|Mr\.|Page|\Z)', re.DOTALL | re.IGNORECASE
+)
+_INDIAN_TX_RE = re.compile(r'(\d{2}-[A-Z]{3}-\d{2})\s+(.+?)\s+(Cr|Dr)\s+([\d,]+\.\d{2})', re.IGNORECASE)
+
+
+def _ws(s: str) -> str:
+    """Strip s and collapse each internal whitespace run to one space"""
+    return ' '.join(s.split())
+
+
+def _parse_amount(amount_str: str) -> float:
+    """
+    Parse a statement amount, raising ValueError when it isn't a number.
+    Most amounts only carry thousands separators, and str.replace + float is several
+    times faster than a dict-backed translate, so the full clean-up is the fallback.
+    """
+    try:
+        return float(amount_str.replace(',', ''))
+    except ValueError:
+        return float(amount_str.translate(_AMT_TRANS))
+
+
+def _to_float(amount_str: str) -> float:
+    """Parse a statement amount, returning 0.0 when it isn't a number"""
+    try:
+        return _parse_amount(amount_str)
+    except ValueError:
+        return 0.0
+
+
+def _first_of_each(pattern, text: str) -> Dict[str, str]:
+    """
+    Scan once with an alternation of named branches, each capturing its value in its own group.
+    Returns branch name -> value of that branch's first match, stopping once every branch has hit.
+    """
+    found = {}
+    for match in pattern.finditer(text):
+        found.setdefault(match.lastgroup, match.group(match.lastgroup))
+        if len(found) == len(pattern.groupindex):
+            break
+    return found
+
+
+def _tx_key(tx: Dict, desc_chars: Union[int, None] = None) -> Hashable:
+    """
+    Dedup key for a transaction: date, description (optionally its first desc_chars) and amount.
+    A 128-bit xxh3 digest of that tuple's repr when xxhash is installed, the plain tuple otherwise;
+    both group exactly the same transactions.
+    """
+    # Adding 0.0 turns -0.0 into 0.0, the one pair of equal floats whose reprs differ
+    key = (tx['date'], tx['description'][:desc_chars], tx['amount'] + 0.0)
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_intdigest(repr(key).encode('utf-8', 'surrogatepass'))
+    return key
+
+
+def _text_digest(text: str) -> Hashable:
+    """Content key for extracted statement text: xxh3_128 when xxhash is installed, SHA-256 otherwise"""
+    data = text.encode('utf-8', 'surrogatepass')
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_intdigest(data)
+    return hashlib.sha256(data).digest()
+
+
+def _lines_after(text: str, label: str) -> Iterator[str]:
+    """Yield the line following each line that contains label, found with str.find rather than a split"""
+    pos = text.find(label)
+    while pos != -1:
+        line_end = text.find('\n', pos)
+        if line_end == -1:
+            return
+        next_end = text.find('\n', line_end + 1)
+        if next_end == -1:
+            next_end = len(text)
+        yield text[line_end + 1:next_end]
+        pos = text.find(label, line_end + 1)
+
+
+def _match_at(pattern, text: str, positions: List[int]) -> Union[re.Match, None]:
+    """First match of pattern anchored at one of the given offsets, in order"""
+    for pos in positions:
+        match = pattern.match(text, pos)
+        if match:
+            return match
+    return None
+
+
+class CorruptPDFError(ValueError):
+    """Raised when a PDF can't be read because the file itself is damaged"""
 
 
-@dataclass
+@dataclass(slots=True)
 class CreditCardData:
     """Standardized data structure for all credit card statements"""
     bank_name: str
@@ -51,7 +381,8 @@ class CreditCardData:
 class CreditCardParser:
     """Main parser class with bank-specific adapters"""
 
-    def __init__(self, enable_ocr: bool = True):
+    def __init__(self, enable_ocr: bool = True, ocr_resolution: int = OCR_RESOLUTION,
+                 ocr_workers: Union[int, None] = None):
         self.bank_identifiers = {
             'HDFC': ['HDFC Bank', 'HDFC BANK', 'Paytm HDFC'],
             'ICICI': ['ICICI Bank', 'ICICI BANK', 'ICICI CARD'],
@@ -59,148 +390,169 @@ class CreditCardParser:
             'IDFC First': ['IDFC FIRST', 'IDFC FIRST BANK', 'IDFC Bank'],
             'Indian Bank': ['Indian Bank', 'INDIAN BANK', 'IBGCC']
         }
+        # One case-insensitive alternation over every identifier, mapped back to its bank
+        self._id_to_bank = {i.upper(): bank for bank, ids in self.bank_identifiers.items() for i in ids}
+        self._bank_regex = re.compile('|'.join(map(re.escape, self._id_to_bank)), re.IGNORECASE)
         self.enable_ocr = enable_ocr and OCR_AVAILABLE
+        self.ocr_resolution = ocr_resolution
+        # Threads OCR'ing pages at once; defaults to one per CPU
+        self.ocr_workers = ocr_workers or os.cpu_count() or 1
+        self._parse_cache = OrderedDict()
+        self._text_cache = OrderedDict()
+
+        # Banks whose extractors each fill one field (or a tuple of fields, from a tuple result)
+        # are assembled straight from this table
+        self._bank_extractors = {
+            'HDFC': [
+                ('cardholder_name', self._extract_hdfc_name_fixed),
+                ('card_last_4', self._extract_hdfc_card_last_4_fixed),
+                ('statement_date', self._extract_hdfc_statement_date_fixed),
+                (('payment_due_date', 'total_amount_due', 'minimum_amount_due'), self._extract_hdfc_dues_fixed),
+                ('credit_limit', self._extract_hdfc_credit_limit_fixed),
+                ('available_credit', self._extract_hdfc_available_credit_fixed),
+                ('transactions', self._extract_hdfc_transactions_fixed),
+            ],
+            'ICICI': [
+                ('cardholder_name', self._extract_icici_name),
+                ('card_last_4', self._extract_icici_card_last_4),
+                ('statement_date', self._extract_icici_statement_date),
+                ('payment_due_date', self._extract_icici_due_date),
+                ('total_amount_due', self._extract_icici_total_due),
+                ('minimum_amount_due', self._extract_icici_min_due),
+                ('credit_limit', self._extract_icici_credit_limit),
+                ('available_credit', self._extract_icici_available_credit),
+                ('transactions', self._extract_icici_transactions),
+            ],
+        }
+        # The rest split multi-field extractor results in their own parse methods
+        self._bank_parsers = {
+            'Axis': self._parse_axis,
+            'IDFC First': self._parse_idfc,
+            'Indian Bank': self._parse_indian_bank,
+        }
         if enable_ocr and not OCR_AVAILABLE:
-            print("⚠️  OCR is enabled but pytesseract/PIL not available. Install with: pip install pytesseract pillow")
+            print("⚠️  OCR is enabled but no OCR engine is available. Install with: pip install tesserocr pillow "
+                  "(or pytesseract pillow)")
 
     def identify_bank(self, text: str) -> str:
         """Identify which bank issued the statement"""
-        text_upper = text.upper()
-        for bank, identifiers in self.bank_identifiers.items():
-            for identifier in identifiers:
-                if identifier.upper() in text_upper:
-                    return bank
-        return "UNKNOWN"
-
-    def parse_statement(self, pdf_path: str) -> CreditCardData:
-        """Main parsing function with encrypted PDF and scanned PDF support"""
-        # First, check if PDF is corrupted
+        match = self._bank_regex.search(text)
+        return self._id_to_bank[match.group(0).upper()] if match else "UNKNOWN"
+
+    def parse_statement(self, pdf_path: str, password: Union[str, None] = None,
+                        interactive: bool = True) -> CreditCardData:
+        """
+        Main parsing function with encrypted PDF and scanned PDF support.
+        Encrypted PDFs use password when given; otherwise the user is prompted, or a
+        ValueError is raised when interactive is False.
+        """
+        # Corrupted files are reported by the first real open (encryption check or extraction)
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                # Try to access pages to check if PDF is corrupted
-                _ = pdf.pages[0]
-        except Exception as e:
-            error_msg = str(e).lower()
-            if any(keyword in error_msg for keyword in ["corrupt", "cannot read", "invalid", "malformed", "decrypt"]):
-                print("corrupt")
-                return CreditCardData(
-                    bank_name='CORRUPT',
-                    cardholder_name="corrupt",
-                    card_last_4="corrupt",
-                    statement_date="corrupt",
-                    payment_due_date="corrupt",
-                    total_amount_due=0.0,
-                    minimum_amount_due=0.0,
-                    credit_limit=0.0,
-                    available_credit=0.0,
-                    transactions=[]
-                )
-            else:
-                # Re-raise if it's a different error
-                raise e
-        
+            return self._parse_pdf(pdf_path, password, interactive)
+        except CorruptPDFError:
+            print("corrupt")
+            return CreditCardData(
+                bank_name='CORRUPT',
+                cardholder_name="corrupt",
+                card_last_4="corrupt",
+                statement_date="corrupt",
+                payment_due_date="corrupt",
+                total_amount_due=0.0,
+                minimum_amount_due=0.0,
+                credit_limit=0.0,
+                available_credit=0.0,
+                transactions=[]
+            )
+
+    def _parse_pdf(self, pdf_path: str, password: Union[str, None] = None,
+                   interactive: bool = True) -> CreditCardData:
+        """Decrypt if needed, extract text and route it to the bank parser"""
         # First, check if PDF is encrypted and handle it
-        decrypted_pdf_path = self._check_and_decrypt_pdf(pdf_path)
-        
-        try:
-            # Extract text with OCR fallback for scanned PDFs
-            text = self._extract_text_with_ocr_fallback(decrypted_pdf_path)
-
-            if not text.strip():
-                raise ValueError("No text found in PDF even with OCR")
-
-            bank_name = self.identify_bank(text)
-
-            # Route to bank-specific parser
-            if bank_name == "HDFC":
-                return self._parse_hdfc_fixed(text)
-            elif bank_name == "ICICI":
-                return self._parse_icici_improved(text)
-            elif bank_name == "Axis":
-                return self._parse_axis(text)
-            elif bank_name == "IDFC First":
-                return self._parse_idfc(text)
-            elif bank_name == "Indian Bank":
-                return self._parse_indian_bank(text)
-            else:
-                return self._parse_generic(text)
-        finally:
-            # Clean up temporary decrypted file if it was created
-            if decrypted_pdf_path != pdf_path and os.path.exists(decrypted_pdf_path):
-                os.remove(decrypted_pdf_path)
+        pdf_source = self._check_and_decrypt_pdf(pdf_path, password, interactive)
 
-    def _check_and_decrypt_pdf(self, pdf_path: str) -> str:
+        # Extract text with OCR fallback for scanned PDFs
+        text = self._extract_text_with_ocr_fallback(pdf_source)
+
+        if not text.strip():
+            raise ValueError("No text found in PDF even with OCR")
+
+        return self._parse_text(text)
+
+    def parse_statement_cached(self, pdf_path: str) -> CreditCardData:
+        """parse_statement memoized on the SHA-256 of the file contents"""
+        with open(pdf_path, 'rb') as f:
+            key = (hashlib.sha256(f.read()).hexdigest(), self.enable_ocr, self.ocr_resolution)
+        data = self._parse_cache.get(key)
+        if data is None:
+            data = self.parse_statement(pdf_path)
+            self._parse_cache[key] = data
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        else:
+            self._parse_cache.move_to_end(key)
+        # Hand out a copy so callers can't mutate the cached entry
+        return replace(data, transactions=[dict(tx) for tx in data.transactions])
+
+    def _parse_text(self, text: str) -> CreditCardData:
         """
-        Check if PDF is encrypted and decrypt it if needed.
-        Returns path to decrypted PDF (original path if not encrypted).
+        _route_text memoized on a digest of the text, so a statement whose extracted
+        text was already seen skips every bank extractor.
+        Only call this for the result _parse_pdf returns; a trial parse that may be
+        discarded should call _route_text so it never takes a cache slot.
         """
-        try:
-            # First, try to open with PyPDF to check encryption
-            with open(pdf_path, 'rb') as file:
-                reader = PdfReader(file)
-                
-                if reader.is_encrypted:
-                    print("🔐 PDF is encrypted. Attempting decryption...")
-                    
-                    # Try empty password first
-                    try:
-                        if reader.decrypt(""):
-                            print("✅ PDF decrypted with empty password")
-                        else:
-                            raise Exception("Empty password failed")
-                    except Exception:
-                        # Prompt for password
-                        password = input("🔐 Enter PDF password: ").strip()
-                        if not password:
-                            raise ValueError("No password provided for encrypted PDF")
-                        
-                        # Try with provided password
-                        if reader.decrypt(password):
-                            print("✅ PDF decrypted successfully with provided password")
-                        else:
-                            raise ValueError("Failed to decrypt PDF with provided password")
-                    
-                    # Create decrypted temporary file
-                    writer = PdfWriter()
-                    
-                    for page in reader.pages:
-                        writer.add_page(page)
-                    
-                    # Create temporary file for decrypted PDF
-                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                    temp_path = temp_file.name
-                    temp_file.close()
-                    
-                    with open(temp_path, 'wb') as output_file:
-                        writer.write(output_file)
-                    
-                    return temp_path
-                else:
-                    # PDF is not encrypted, return original path
-                    return pdf_path
-                    
-        except Exception as e:
-            # If PyPDF fails, try direct pdfplumber (might handle some encrypted PDFs)
-            try:
-                with pdfplumber.open(pdf_path) as pdf:
-                    # If we get here, pdfplumber could open it
-                    return pdf_path
-            except Exception as pdfplumber_error:
-                if "encrypted" in str(pdfplumber_error).lower() or "password" in str(pdfplumber_error).lower():
-                    print("🔐 PDF appears to be encrypted but PyPDF couldn't handle it.")
-                    password = input("🔐 Enter PDF password: ").strip()
-                    if password:
-                        # Try to decrypt using alternative method
-                        return self._decrypt_with_password(pdf_path, password)
-                    else:
-                        raise ValueError("No password provided for encrypted PDF")
+        key = _text_digest(text)
+        data = self._text_cache.get(key)
+        if data is None:
+            data = self._route_text(text)
+            self._text_cache[key] = data
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        # Hand out a copy so callers can't mutate the cached entry
+        return replace(data, transactions=[dict(tx) for tx in data.transactions])
+
+    def _route_text(self, text: str) -> CreditCardData:
+        """Route extracted statement text to the matching bank parser"""
+        bank_name = self.identify_bank(text)
+
+        # Route to bank-specific parser
+        extractors = self._bank_extractors.get(bank_name)
+        if extractors is not None:
+            fields = {}
+            for field, fn in extractors:
+                if isinstance(field, tuple):
+                    fields.update(zip(field, fn(text)))
                 else:
-                    raise ValueError(f"Error reading PDF: {pdfplumber_error}")
+                    fields[field] = fn(text)
+            return CreditCardData(bank_name=bank_name, **fields)
+        return self._bank_parsers.get(bank_name, self._parse_generic)(text)
+
+    @staticmethod
+    def _dedup(transactions: List[Dict], key_fn: Callable[[Dict], Hashable]) -> List[Dict]:
+        """Drop repeated transactions, keeping the first occurrence of each key in order"""
+        unique = {}
+        for tx in transactions:
+            unique.setdefault(key_fn(tx), tx)
+        return list(unique.values())
 
-    def _check_and_decrypt_pdf(self, pdf_path: str) -> str:
+    @staticmethod
+    def _resolve_password(password: Union[str, None], interactive: bool) -> str:
+        """The caller's password, else one typed at the prompt; never prompts when not interactive"""
+        if password:
+            return password
+        if not interactive:
+            raise ValueError("PDF is encrypted and no password was given")
+        password = input("🔐 Enter PDF password: ").strip()
+        if not password:
+            raise ValueError("No password provided for encrypted PDF")
+        return password
+
+    def _check_and_decrypt_pdf(self, pdf_path: str, password: Union[str, None] = None,
+                               interactive: bool = True) -> Union[str, io.BytesIO]:
         """
         Check if PDF is encrypted and decrypt it if needed.
-        Returns path to decrypted PDF (original path if not encrypted).
+        Returns the decrypted PDF as an in-memory buffer (original path if not encrypted).
         """
         try:
             # First, try to open with PyPDF to check encryption
@@ -217,32 +569,25 @@ class CreditCardParser:
                         else:
                             raise Exception("Empty password failed")
                     except Exception:
-                        # Prompt for password
-                        password = input("🔐 Enter PDF password: ").strip()
-                        if not password:
-                            raise ValueError("No password provided for encrypted PDF")
+                        # Use the given password, or prompt for one
+                        entered = self._resolve_password(password, interactive)
                         
                         # Try with provided password
-                        if reader.decrypt(password):
+                        if reader.decrypt(entered):
                             print("✅ PDF decrypted successfully with provided password")
                         else:
                             raise ValueError("Failed to decrypt PDF with provided password")
                     
-                    # Create decrypted temporary file
+                    # Write the decrypted copy to memory; pdfplumber reads buffers directly
                     writer = PdfWriter()
                     
                     for page in reader.pages:
                         writer.add_page(page)
                     
-                    # Create temporary file for decrypted PDF
-                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                    temp_path = temp_file.name
-                    temp_file.close()
-                    
-                    with open(temp_path, 'wb') as output_file:
-                        writer.write(output_file)
-                    
-                    return temp_path
+                    buffer = io.BytesIO()
+                    writer.write(buffer)
+                    buffer.seek(0)
+                    return buffer
                 else:
                     # PDF is not encrypted, return original path
                     print("✅ PDF is not encrypted")
@@ -257,30 +602,42 @@ class CreditCardParser:
                     print("✅ PDF opened successfully with pdfplumber")
                     return pdf_path
             except Exception as pdfplumber_error:
-                error_msg = str(pdfplumber_error).lower()
-                if "encrypted" in error_msg or "password" in error_msg:
+                if _CORRUPT_ERROR_RE.search(str(pdfplumber_error)):
+                    raise CorruptPDFError(str(pdfplumber_error)) from pdfplumber_error
+                if _ENCRYPTED_ERROR_RE.search(str(pdfplumber_error)):
                     print("🔐 PDF appears to be encrypted but PyPDF couldn't handle it.")
-                    password = input("🔐 Enter PDF password: ").strip()
-                    if password:
-                        # Try to decrypt using alternative method
-                        return self._decrypt_with_password(pdf_path, password)
-                    else:
-                        raise ValueError("No password provided for encrypted PDF")
+                    entered = self._resolve_password(password, interactive)
+                    # Try to decrypt using alternative method
+                    return self._decrypt_with_password(pdf_path, entered)
                 else:
                     raise ValueError(f"Error reading PDF: {pdfplumber_error}")
 
-    def _extract_text_with_ocr_fallback(self, pdf_path: str) -> str:
+    def _extract_text_with_ocr_fallback(self, pdf_source: Union[str, io.BytesIO]) -> str:
         """
         Extract text from PDF, using OCR if the PDF appears to be scanned/image-based.
         """
-        text = ""
-        
+        parts = []
+
+        # Only a failure to open the file or read its page tree means the PDF itself is damaged
+        pdf = None
+        try:
+            pdf = pdfplumber.open(pdf_source)
+            pages = pdf.pages
+        except Exception as e:
+            if pdf is not None:
+                pdf.close()
+            if _CORRUPT_ERROR_RE.search(str(e)):
+                raise CorruptPDFError(str(e)) from e
+            return self._extract_text_after_error(pdf_source, e)
+
         try:
             # First attempt: try to extract text directly
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text(layout=True) or page.extract_text() or ""
-                    text += page_text + "\n"
+            with pdf:
+                for page in pages:
+                    # Image-only pages carry no chars; skip both layout passes for them
+                    page_text = page.extract_text(layout=True) if page.chars else ""
+                    parts.append(page_text + "\n")
+                text = "".join(parts)
                 
                 # Check if we got meaningful text
                 if len(text.strip()) > 100:  # Arbitrary threshold for "enough text"
@@ -295,185 +652,211 @@ class CreditCardParser:
                     return text
                     
         except Exception as e:
-            print(f"⚠️  Error in text extraction: {e}")
-            if self.enable_ocr:
-                print("🔄 Falling back to OCR...")
-                try:
-                    with pdfplumber.open(pdf_path) as pdf:
-                        return self._extract_text_with_ocr(pdf)
-                except Exception as ocr_error:
-                    raise ValueError(f"Both text extraction and OCR failed: {ocr_error}")
-            else:
-                raise ValueError(f"Text extraction failed and OCR is disabled: {e}")
+            return self._extract_text_after_error(pdf_source, e)
+
+    def _extract_text_after_error(self, pdf_source: Union[str, io.BytesIO], error: Exception) -> str:
+        """Fallback when direct extraction fails part-way: OCR the whole document if enabled"""
+        print(f"⚠️  Error in text extraction: {error}")
+        if self.enable_ocr:
+            print("🔄 Falling back to OCR...")
+            try:
+                with pdfplumber.open(pdf_source) as pdf:
+                    return self._extract_text_with_ocr(pdf)
+            except Exception as ocr_error:
+                raise ValueError(f"Both text extraction and OCR failed: {ocr_error}")
+        else:
+            raise ValueError(f"Text extraction failed and OCR is disabled: {error}")
 
     def _extract_text_with_ocr(self, pdf) -> str:
         """
         Extract text from PDF using OCR for scanned/image-based PDFs.
         """
         if not OCR_AVAILABLE:
-            raise ValueError("OCR is not available. Install pytesseract and pillow.")
+            raise ValueError("OCR is not available. Install pillow with tesserocr or pytesseract.")
         
-        text = ""
+        parts = []
         total_pages = len(pdf.pages)
         
         print(f"🔍 Processing {total_pages} page(s) with OCR...")
         
-        for i, page in enumerate(pdf.pages, 1):
-            try:
-                # Convert page to image
-                image = page.to_image(resolution=300)
-                
-                # Use pytesseract to extract text from the image
-                page_text = pytesseract.image_to_string(image.original, config='--psm 6')
-                
-                if page_text.strip():
-                    text += f"--- Page {i} ---\n{page_text}\n"
-                    print(f"✅ Processed page {i}/{total_pages}")
-                else:
-                    print(f"⚠️  No text found on page {i}/{total_pages}")
-                    
-            except Exception as e:
-                print(f"❌ Error processing page {i} with OCR: {e}")
-                continue
+        pages = list(enumerate(pdf.pages, 1))
+        results = self._ocr_pages(pages, self.ocr_resolution)
+
+        if self.ocr_resolution < OCR_FALLBACK_RESOLUTION:
+            retry = [
+                (i, page) for i, page in pages
+                if isinstance(results[i], str) and len(results[i].strip()) < OCR_MIN_PAGE_CHARS
+            ]
+            if retry:
+                print(f"🔄 Retrying {len(retry)} page(s) at {OCR_FALLBACK_RESOLUTION} DPI...")
+                # Keep the first pass unless the retry actually read more text
+                for i, retried in self._ocr_pages(retry, OCR_FALLBACK_RESOLUTION).items():
+                    if isinstance(retried, str) and len(retried.strip()) > len(results[i].strip()):
+                        results[i] = retried
+
+        for i, page_text in results.items():
+            if isinstance(page_text, Exception):
+                print(f"❌ Error processing page {i} with OCR: {page_text}")
+            elif page_text.strip():
+                parts.append(f"--- Page {i} ---\n{page_text}\n")
+                print(f"✅ Processed page {i}/{total_pages}")
+            else:
+                print(f"⚠️  No text found on page {i}/{total_pages}")
         
+        text = "".join(parts)
         if not text.strip():
             raise ValueError("OCR could not extract any text from the PDF")
         
         print(f"✅ OCR completed. Extracted {len(text)} characters.")
         return text
 
-    # ========== HDFC PARSER (Fixed) ==========
-    def _parse_hdfc_fixed(self, text: str) -> CreditCardData:
-        cardholder_name = self._extract_hdfc_name_fixed(text)
-        card_last_4 = self._extract_hdfc_card_last_4_fixed(text)
-        statement_date = self._extract_hdfc_statement_date_fixed(text)
-        payment_due_date = self._extract_hdfc_due_date_fixed(text)
-        total_amount_due = self._extract_hdfc_total_due_fixed(text)
-        minimum_amount_due = self._extract_hdfc_min_due_fixed(text)
-        credit_limit = self._extract_hdfc_credit_limit_fixed(text)
-        available_credit = self._extract_hdfc_available_credit_fixed(text)
-        transactions = self._extract_hdfc_transactions_fixed(text)
+    def _ocr_pages(self, pages, resolution: int) -> Dict:
+        """
+        OCR (page number, page) pairs concurrently.
+        Returns page number -> text, or the exception that page raised, in page order.
+        """
+        # Render on this thread; pdfplumber pages are not safe to share across threads
+        results = {}
+        images = []
+        for i, page in pages:
+            try:
+                images.append((i, page.to_image(resolution=resolution).original))
+            except Exception as e:
+                results[i] = e
+
+        engines = []
+        tesserocr = _load_tesserocr() if TESSEROCR_AVAILABLE else None
+        if tesserocr is not None:
+            # One engine per worker thread, loaded once and reused for every page it handles
+            local = threading.local()
+
+            def ocr_page(image):
+                api = getattr(local, 'api', None)
+                if api is None:
+                    api = local.api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK,
+                                                             oem=tesserocr.OEM.LSTM_ONLY)
+                    engines.append(api)
+                api.SetImage(image)
+                return api.GetUTF8Text()
+        else:
+            def ocr_page(image):
+                return pytesseract.image_to_string(image, config=OCR_CONFIG)
 
-        return CreditCardData(
-            bank_name='HDFC',
-            cardholder_name=cardholder_name,
-            card_last_4=card_last_4,
-            statement_date=statement_date,
-            payment_due_date=payment_due_date,
-            total_amount_due=total_amount_due,
-            minimum_amount_due=minimum_amount_due,
-            credit_limit=credit_limit,
-            available_credit=available_credit,
-            transactions=transactions
-        )
+        # Tesseract does its work outside the GIL, so threads are enough to overlap pages
+        try:
+            with ThreadPoolExecutor(max_workers=self.ocr_workers) as executor:
+                futures = [(i, executor.submit(ocr_page, image)) for i, image in images]
+        finally:
+            for api in engines:
+                api.End()
+
+        for i, future in futures:
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = e
+        return dict(sorted(results.items()))
 
+    # ========== HDFC PARSER (Fixed) ==========
     def _extract_hdfc_name_fixed(self, text: str) -> str:
-        match = re.search(r'Name\s*:\s*([A-Z][A-Za-z\s]+?)(?:\n|Email)', text, re.IGNORECASE)
+        match = _HDFC_NAME_RE.search(text)
         if match:
             name = match.group(1).strip()
-            name = re.sub(r'[^A-Za-z\s]+$', '', name).strip()
+            name = _TRAILING_NON_ALPHA_RE.sub('', name).strip()
             if name and len(name) > 2:
                 return name
-        match = re.search(r'Name\s*:\s*([A-Z\s]+)\s*\n\s*000', text)
+        match = _HDFC_NAME_BEFORE_000_RE.search(text)
         if match:
             name = match.group(1).strip()
-            name = re.sub(r'[^A-Za-z\s]+$', '', name).strip()
+            name = _TRAILING_NON_ALPHA_RE.sub('', name).strip()
             if name and len(name) > 2:
                 return name
-        match = re.search(r'Domestic Transactions\s+Date\s+Transaction Description\s+Amount.*?\n\s*([A-Z][A-Z\s]+[A-Z])\s*\n\s*\d{2}/\d{2}/\d{4}', text, re.DOTALL)
+        match = _HDFC_NAME_TX_HEADER_RE.search(text)
         if match:
             name = match.group(1).strip()
-            if name and len(name.split()) >= 2 and not any(word in name for word in ['PAYTM', 'TRANSACTION', 'AMOUNT', 'DATE', 'NOIDA', 'DELHI']):
+            if name and len(name.split()) >= 2 and not any(word in name for word in _HDFC_NAME_SKIP):
                 return name
         return "Not Found"
 
     def _extract_hdfc_card_last_4_fixed(self, text: str) -> str:
-        pattern1 = r'Card No:\s*\d{4}\s*\d{2}XX\s*XXXX\s*(\d{4})'
-        match = re.search(pattern1, text)
+        match = _HDFC_CARD_NO_RE.search(text)
         if match:
             return match.group(1)
-        pattern2 = r'\d{4}\s+\d{2}X+\s+X+\s+(\d{4})'
-        match = re.search(pattern2, text)
+        match = _HDFC_MASKED_CARD_RE.search(text)
         if match:
             return match.group(1)
         return "Not Found"
 
     def _extract_hdfc_statement_date_fixed(self, text: str) -> str:
-        pattern = r'Statement Date:\s*(\d{2}/\d{2}/\d{4})'
-        match = re.search(pattern, text)
+        match = _HDFC_STATEMENT_DATE_RE.search(text)
         if match:
             return match.group(1)
         return "Not Found"
 
-    def _extract_hdfc_due_date_fixed(self, text: str) -> str:
-        pattern1 = r'Payment Due Date\s+Total Dues.*?\n(\d{2}/\d{2}/\d{4})'
-        match = re.search(pattern1, text, re.DOTALL)
-        if match:
-            return match.group(1)
-        pattern2 = r'(\d{2}/\d{2}/\d{4})\s+[\d,]+\.[\d]{2}\s+[\d,]+\.[\d]{2}'
-        match = re.search(pattern2, text)
+    def _extract_hdfc_dues_fixed(self, text: str) -> tuple:
+        """Due date, total dues and minimum due, which share one dues row searched once here"""
+        row = _HDFC_DUES_ROW_RE.search(text)
+        return (
+            self._extract_hdfc_due_date_fixed(text, row),
+            self._extract_hdfc_total_due_fixed(text, row),
+            self._extract_hdfc_min_due_fixed(text, row),
+        )
+
+    def _extract_hdfc_due_date_fixed(self, text: str, row: Union[re.Match, None]) -> str:
+        match = _HDFC_DUE_DATE_RE.search(text)
         if match:
             return match.group(1)
+        if row:
+            return row.group(1)
         return "Not Found"
 
-    def _extract_hdfc_total_due_fixed(self, text: str) -> float:
-        pattern1 = r'(\d{2}/\d{2}/\d{4})\s+([\d,]+\.[\d]{2})\s+([\d,]+\.[\d]{2})'
-        match = re.search(pattern1, text)
-        if match:
-            amount_str = match.group(2).replace(',', '')
+    def _extract_hdfc_total_due_fixed(self, text: str, row: Union[re.Match, None]) -> float:
+        if row:
             try:
-                return float(amount_str)
+                return _parse_amount(row.group(2))
             except ValueError:
                 pass
-        pattern2 = r'Total Dues[^\d]+([\d,]+\.[\d]{2})'
-        match = re.search(pattern2, text)
+        match = _HDFC_TOTAL_DUES_RE.search(text)
         if match:
-            amount_str = match.group(1).replace(',', '')
             try:
-                return float(amount_str)
+                return _parse_amount(match.group(1))
             except ValueError:
                 pass
         return 0.0
 
-    def _extract_hdfc_min_due_fixed(self, text: str) -> float:
-        pattern1 = r'(\d{2}/\d{2}/\d{4})\s+([\d,]+\.[\d]{2})\s+([\d,]+\.[\d]{2})'
-        match = re.search(pattern1, text)
-        if match:
-            amount_str = match.group(3).replace(',', '')
+    def _extract_hdfc_min_due_fixed(self, text: str, row: Union[re.Match, None]) -> float:
+        if row:
             try:
-                return float(amount_str)
+                return _parse_amount(row.group(3))
             except ValueError:
                 pass
-        pattern2 = r'Minimum Amount Due[^\d]+([\d,]+\.[\d]{2})'
-        match = re.search(pattern2, text)
+        match = _HDFC_MIN_DUE_RE.search(text)
         if match:
-            amount_str = match.group(1).replace(',', '')
             try:
-                return float(amount_str)
+                return _parse_amount(match.group(1))
             except ValueError:
                 pass
         return 0.0
 
     def _extract_hdfc_credit_limit_fixed(self, text: str) -> float:
-        match = re.search(r'Credit Limit\s+Available Credit Limit\s+Available Cash Limit\s*\n\s*([\d,]+)', text, re.IGNORECASE)
+        # All three patterns start with the label, so locate it once and only try them there
+        labels = [m.start() for m in _CREDIT_LIMIT_LABEL_RE.finditer(text)]
+        match = _match_at(_HDFC_CREDIT_LIMIT_TABLE_RE, text, labels)
         if match:
-            amount_str = match.group(1).replace(',', '')
             try:
-                return float(amount_str)
+                return _parse_amount(match.group(1))
             except ValueError:
                 pass
-        match = re.search(r'Credit Limit\s*\|\s*([\d,]+)', text, re.IGNORECASE)
+        match = _match_at(_HDFC_CREDIT_LIMIT_PIPE_RE, text, labels)
         if match:
-            amount_str = match.group(1).replace(',', '')
             try:
-                return float(amount_str)
+                return _parse_amount(match.group(1))
             except ValueError:
                 pass
-        match = re.search(r'Credit Limit[^\d\n]*([\d,]+)', text, re.IGNORECASE)
+        match = _match_at(_HDFC_CREDIT_LIMIT_INLINE_RE, text, labels)
         if match:
-            amount_str = match.group(1).replace(',', '')
             try:
-                amount = float(amount_str)
+                amount = _parse_amount(match.group(1))
                 if 1000 <= amount <= 1000000000:
                     return amount
             except ValueError:
@@ -481,180 +864,116 @@ class CreditCardParser:
         return 0.0
 
     def _extract_hdfc_available_credit_fixed(self, text: str) -> float:
-        match = re.search(r'Credit Limit\s+Available Credit Limit\s+Available Cash Limit\s*\n\s*([\d,]+)(?:\.[\d]+)?\s+([\d,]+\.[\d]+)', text, re.IGNORECASE)
+        match = _HDFC_AVAILABLE_TABLE_RE.search(text)
         if match:
-            amount_str = match.group(2).replace(',', '')
             try:
-                return float(amount_str)
+                return _parse_amount(match.group(2))
             except ValueError:
                 pass
-        match = re.search(r'Credit Limit\s+Available Credit Limit.*?\n\s*[\d,]+(?:\.\d+)?\s+([\d,]+\.\d+)', text, re.IGNORECASE | re.DOTALL)
+        match = _HDFC_AVAILABLE_BLOCK_RE.search(text)
         if match:
-            amount_str = match.group(1).replace(',', '')
             try:
-                return float(amount_str)
+                return _parse_amount(match.group(1))
             except ValueError:
                 pass
-        match = re.search(r'Available Credit Limit\s*\|\s*([\d,]+\.?\d*)', text, re.IGNORECASE)
+        match = _HDFC_AVAILABLE_PIPE_RE.search(text)
         if match:
-            amount_str = match.group(1).replace(',', '')
             try:
-                return float(amount_str)
+                return _parse_amount(match.group(1))
             except ValueError:
                 pass
         return 0.0
 
     def _extract_hdfc_transactions_fixed(self, text: str) -> List[Dict]:
         transactions = []
-        pattern = r'Domestic Transactions\s+Date\s+Transaction Description\s+Amount.*?(?=Reward Points|$)'
-        domestic_match = re.search(pattern, text, re.DOTALL)
+        domestic_match = _HDFC_DOMESTIC_SECTION_RE.search(text)
         if not domestic_match:
             return transactions
-        transaction_text = domestic_match.group(0)
-        lines = transaction_text.split('\n')
-        excluded_keywords = ['Domestic Transactions', 'Date', 'Transaction Description', 'Amount']
-        for line in lines:
-            line = line.strip()
-            if not line or any(keyword in line for keyword in excluded_keywords):
-                continue
-            if re.match(r'^[A-Z][A-Za-z\s]+[A-Z]$', line):
-                continue
-            tx_pattern = r'(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([\d,]+\.[\d]{2})(\s+Cr)?$'
-            match = re.match(tx_pattern, line)
-            if match:
-                date = match.group(1)
-                description = match.group(2).strip()
-                amount_str = match.group(3).replace(',', '')
-                is_credit = match.group(4) is not None
-                try:
-                    amount = float(amount_str)
-                    if is_credit:
-                        amount = -amount
-                    transactions.append({'date': date, 'description': description, 'amount': amount})
-                except ValueError:
-                    continue
+        for match in _HDFC_TX_RE.finditer(domestic_match.group(0)):
+            amount = _parse_amount(match.group(3))
+            if match.group(4) is not None:
+                amount = -amount
+            transactions.append({'date': match.group(1), 'description': match.group(2).strip(), 'amount': amount})
         return transactions
 
     # ========== ICICI PARSER ==========
-    def _parse_icici_improved(self, text: str) -> CreditCardData:
-        cardholder_name = self._extract_icici_name(text)
-        card_last_4 = self._extract_icici_card_last_4(text)
-        statement_date = self._extract_icici_statement_date(text)
-        payment_due_date = self._extract_icici_due_date(text)
-        total_amount_due = self._extract_icici_total_due(text)
-        minimum_amount_due = self._extract_icici_min_due(text)
-        credit_limit = self._extract_icici_credit_limit(text)
-        available_credit = self._extract_icici_available_credit(text)
-        transactions = self._extract_icici_transactions(text)
-
-        return CreditCardData(
-            bank_name='ICICI',
-            cardholder_name=cardholder_name,
-            card_last_4=card_last_4,
-            statement_date=statement_date,
-            payment_due_date=payment_due_date,
-            total_amount_due=total_amount_due,
-            minimum_amount_due=minimum_amount_due,
-            credit_limit=credit_limit,
-            available_credit=available_credit,
-            transactions=transactions
-        )
-
     def _extract_icici_name(self, text: str) -> str:
-        match = re.search(r'((?:MR|MS|MRS|DR)\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*\n\s*(?:AT/PO|FLAT|HOUSE|[A-Z\s,/]+\n)', text)
+        match = _ICICI_NAME_RE.search(text)
         if match:
             return match.group(1).strip()
         return "Not Found"
 
     def _extract_icici_card_last_4(self, text: str) -> str:
-        match = re.search(r'\d{4}X+(\d{4})', text)
+        match = _ICICI_CARD_RE.search(text)
         if match:
             return match.group(1)
         return "Not Found"
 
     def _extract_icici_statement_date(self, text: str) -> str:
-        match = re.search(r'STATEMENT DATE.*?([A-Z][a-z]+\s+\d{1,2},\s+\d{4})', text, re.IGNORECASE | re.DOTALL)
+        match = _ICICI_STATEMENT_DATE_RE.search(text)
         if match:
             return match.group(1)
-        match = re.search(r'Statement period\s*:\s*[A-Za-z]+\s+\d{1,2},\s+\d{4}\s+to\s+([A-Z][a-z]+\s+\d{1,2},\s+\d{4})', text)
+        match = _ICICI_STATEMENT_PERIOD_RE.search(text)
         if match:
             return match.group(1)
         return "Not Found"
 
     def _extract_icici_due_date(self, text: str) -> str:
-        match = re.search(r'PAYMENT DUE DATE.*?([A-Z][a-z]+\s+\d{1,2},\s+\d{4})', text, re.IGNORECASE | re.DOTALL)
+        match = _ICICI_DUE_DATE_RE.search(text)
         if match:
             return match.group(1).strip()
-        dates = re.findall(r'([A-Z][a-z]+\s+\d{1,2},\s+\d{4})', text[:1000])
+        dates = _LONG_DATE_RE.findall(text, 0, 1000)
         if len(dates) >= 2:
             return dates[1]
         return "Not Found"
 
     def _extract_icici_total_due(self, text: str) -> float:
-        match = re.search(r'Total Amount due\s+[`₹]?\s*([\d,]+\.?\d*)', text, re.IGNORECASE)
+        match = _ICICI_TOTAL_DUE_RE.search(text)
         if match:
-            amount_str = match.group(1).replace(',', '').replace('`', '')
             try:
-                return float(amount_str)
+                return _parse_amount(match.group(1))
             except ValueError:
                 pass
         return 0.0
 
     def _extract_icici_min_due(self, text: str) -> float:
-        patterns = [
-            r'Minimum\s+Amount\s+due\s*[:\-]?\s*[`₹]?\s*([\d,]+\.?\d*)',
-            r'Minimum\s+Amount\s*[:\-]?\s*[`₹]?\s*([\d,]+\.?\d*)',
-            r'Minimum\s+Amount\s+Payable\s*[:\-]?\s*[`₹]?\s*([\d,]+\.?\d*)',
-            r'Amount\s+Due\s+\(Minimum\)\s*[`₹]?\s*([\d,]+\.?\d*)'
-        ]
-        for pat in patterns:
-            match = re.search(pat, text, re.IGNORECASE)
+        for pat in _ICICI_MIN_DUE_PATTERNS:
+            match = pat.search(text)
             if match:
-                amount_str = match.group(1).replace(',', '').replace('`', '')
+                # A capture that isn't a number falls through to the next pattern
                 try:
-                    return float(amount_str)
+                    return _parse_amount(match.group(1))
                 except ValueError:
                     continue
 
-        label_match = re.search(r'Minimum\s+Amount\s+due', text, re.IGNORECASE)
+        label_match = _ICICI_MIN_DUE_LABEL_RE.search(text)
         if label_match:
-            lines = text.splitlines()
-            char_index = 0
-            found_line_idx = None
-            for idx, ln in enumerate(lines):
-                start = char_index
-                end = char_index + len(ln) + 1
-                if start <= label_match.start() < end:
-                    found_line_idx = idx
+            # The label's line and up to three lines after it
+            line_start = text.rfind('\n', 0, label_match.start()) + 1
+            line_end = line_start - 1
+            for _ in range(4):
+                line_end = text.find('\n', line_end + 1)
+                if line_end < 0:
+                    line_end = len(text)
                     break
-                char_index = end
-            if found_line_idx is not None:
-                for offset in range(0, 4):
-                    li = found_line_idx + offset
-                    if li >= len(lines):
-                        break
-                    line = lines[li].strip()
-                    nums = re.findall(r'[`₹]?\s*([\d,]+\.?\d*)', line)
-                    for n in nums:
-                        try:
-                            val = float(n.replace(',', '').replace('`', ''))
-                            if val > 0:
-                                return val
-                        except ValueError:
-                            continue
+            for line in text[line_start:line_end].split('\n'):
+                nums = _AMOUNT_TOKEN_RE.findall(line.strip())
+                for n in nums:
+                    val = _to_float(n)
+                    if val > 0:
+                        return val
 
         total = None
-        total_match = re.search(r'Total\s+Amount\s+due\s*[`₹]?\s*([\d,]+\.?\d*)', text, re.IGNORECASE)
+        total_match = _ICICI_TOTAL_DUE_LOOSE_RE.search(text)
         if total_match:
             try:
-                total = float(total_match.group(1).replace(',', '').replace('`', ''))
+                total = _parse_amount(total_match.group(1))
             except ValueError:
                 total = None
 
         anchor_pos = None
-        m2 = re.search(r'Minimum\s+Amount\s+due', text, re.IGNORECASE)
-        if m2:
-            anchor_pos = m2.end()
+        if label_match:
+            anchor_pos = label_match.end()
         elif total_match:
             anchor_pos = total_match.end()
 
@@ -662,92 +981,47 @@ class CreditCardParser:
             window_start = max(0, anchor_pos - 200)
             window_end = min(len(text), anchor_pos + 400)
             window = text[window_start:window_end]
-            nums = re.findall(r'[`₹]?\s*([\d,]+\.?\d*)', window)
-            cleaned = []
-            for n in nums:
-                try:
-                    cleaned.append(float(n.replace(',', '').replace('`', '')))
-                except ValueError:
-                    continue
-            if cleaned:
-                for v in cleaned:
-                    if v > 0 and (total is None or v <= total):
-                        return v
+            for n in _AMOUNT_TOKEN_RE.finditer(window):
+                v = _to_float(n.group(1))
+                if v > 0 and (total is None or v <= total):
+                    return v
 
         for line in text.splitlines():
-            if 'MINIMUM' in line.upper() or 'MIN DUE' in line.upper():
-                nums = re.findall(r'[`₹]?\s*([\d,]+\.?\d*)', line)
+            if _MIN_DUE_LINE_RE.search(line):
+                nums = _AMOUNT_TOKEN_RE.findall(line)
                 for n in nums:
-                    try:
-                        val = float(n.replace(',', '').replace('`', ''))
-                        if val > 0:
-                            return val
-                    except ValueError:
-                        continue
+                    val = _to_float(n)
+                    if val > 0:
+                        return val
         return 0.0
 
     def _extract_icici_credit_limit(self, text: str) -> float:
-        match = re.search(
-            r"Credit Limit \(Including cash\)\s+Available Credit.*?[`₹]\s*([\d,]+\.?\d*)",
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
+        match = _ICICI_CREDIT_LIMIT_RE.search(text)
         if match:
-            amount_str = match.group(1).replace(',', '')
-            try:
-                return float(amount_str)
-            except ValueError:
-                pass
+            return _to_float(match.group(1))
         return 0.0
 
     def _extract_icici_available_credit(self, text: str) -> float:
-        match = re.search(
-            r"Credit Limit \(Including cash\)\s+Available Credit \(Including cash\).*?[`₹]\s*[\d,]+\.?\d*\s+[`₹]\s*([\d,]+\.?\d*)",
-            text,
-            re.IGNORECASE | re.DOTALL
-        )
+        match = _ICICI_AVAILABLE_CREDIT_RE.search(text)
         if match:
-            amount_str = match.group(1).replace(',', '')
-            try:
-                return float(amount_str)
-            except ValueError:
-                pass
+            return _to_float(match.group(1))
         return 0.0
 
     def _extract_icici_transactions(self, text: str) -> List[Dict]:
         transactions = []
-        pattern = re.compile(
-            r'(\d{2}/\d{2}/\d{4})\s+'  # Date
-            r'(\d+)\s+'  # Serial number
-            r'(.+?)\s+'  # Description
-            r'(?:IN\s+)?'  # Optional "IN"
-            r'([\d,]+\.?\d*)\s*'  # Amount
-            r'(CR)?'  # Optional CR
-            r'(?:\s*$)',  # End of line
-            re.MULTILINE
-        )
-        matches = pattern.findall(text)
-        for match in matches:
-            date, serial, description, amount_str, is_credit = match
-            description = description.strip()
-            description = re.sub(r'\s+', ' ', description)
-            if any(keyword in description.upper() for keyword in ['TRANSACTION DETAILS', 'DATE', 'SERNO', 'AMOUNT', 'INTL', 'STATEMENT']):
+        for match in _ICICI_TX_RE.finditer(text):
+            date, serial, description, amount_str, is_credit = match.groups('')
+            description = _ws(description)
+            if _ICICI_HEADER_RE.search(description):
                 continue
             try:
-                amount = float(amount_str.replace(',', ''))
+                amount = _parse_amount(amount_str)
                 if is_credit:
                     amount = -amount
                 transactions.append({'date': date, 'description': description, 'amount': amount})
             except ValueError:
                 continue
-        seen = set()
-        unique_transactions = []
-        for tx in transactions:
-            key = (tx['date'], tx['description'], tx['amount'])
-            if key not in seen:
-                seen.add(key)
-                unique_transactions.append(tx)
-        return unique_transactions
+        return self._dedup(transactions, _tx_key)
 
     # ========== AXIS PARSER ==========
     def _parse_axis(self, text: str) -> CreditCardData:
@@ -771,35 +1045,35 @@ class CreditCardParser:
         )
 
     def _extract_axis_name(self, text: str) -> str:
-        match = re.search(r'\n([A-Z][A-Z\s,.-]+)\nB/', text)
+        match = _AXIS_NAME_RE.search(text)
         if match:
-            name = re.sub(r'\s+', ' ', match.group(1).strip())
+            name = _ws(match.group(1))
             return name
-        for line in text.splitlines():
-            ln = line.strip()
+        for line_match in _LINE_RE.finditer(text):
+            ln = line_match.group(0).strip()
             if ln.isupper() and len(ln.split()) >= 2 and len(ln) < 60:
-                if not any(k in ln for k in ['AXIS', 'STATEMENT', 'PAYMENT', 'SUMMARY']):
-                    return re.sub(r'\s+', ' ', ln)
+                if not _AXIS_NAME_SKIP_RE.search(ln):
+                    return _ws(ln)
         return "Not Found"
 
     def _extract_axis_card_last_4(self, text: str) -> str:
-        match = re.search(r'(\d{6}\*{6}(\d{4}))|(\*{6}(\d{4}))', text)
+        match = _STAR_CARD_RE.search(text)
         if match:
             for g in match.groups():
-                if g and re.fullmatch(r'\d{4}', g):
+                if g and _FOUR_DIGITS_RE.fullmatch(g):
                     return g
         return "Not Found"
 
-    def _extract_axis_payment_summary(self, text: str):
-        section = text.upper()
-        start = section.find('PAYMENT SUMMARY')
-        end = section.find('AUTO-DEBIT')
-        if start != -1 and end != -1:
-            section = text[start:end + 300]
+    def _extract_axis_payment_summary(self, text: str) -> tuple:
+        start = _AXIS_PAY_START_RE.search(text)
+        end = _AXIS_PAY_END_RE.search(text)
+        if start and end:
+            section = text[start.start():end.start() + 300]
         else:
             section = text
-        dates = re.findall(r'(\d{2}/\d{2}/\d{4})', section)
-        amounts = re.findall(r'([\d\s,]+\.\d{2})\s*Dr', section, re.IGNORECASE)
+        # Only the first three dates and first two Dr amounts are used
+        dates = [m.group(1) for m in islice(_SLASH_DATE_RE.finditer(section), 3)]
+        amounts = [m.group(1) for m in islice(_AXIS_DR_AMOUNT_RE.finditer(section), 2)]
         statement_date = None
         payment_due_date = None
         total_due = 0.0
@@ -816,8 +1090,8 @@ class CreditCardParser:
                 min_due = total_due
         return statement_date, payment_due_date, total_due, min_due
 
-    def _extract_axis_limits(self, text: str):
-        match = re.search(r'\*{4,}\d{4}\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})', text)
+    def _extract_axis_limits(self, text: str) -> tuple:
+        match = _AXIS_LIMITS_RE.search(text)
         if match:
             credit_limit = self._clean_amount_to_float(match.group(1))
             available_credit = self._clean_amount_to_float(match.group(2))
@@ -827,60 +1101,58 @@ class CreditCardParser:
     def _clean_amount_to_float(self, s: str) -> float:
         if not s:
             return 0.0
-        cleaned = re.sub(r'[^\d.\-]', '', s)
         try:
-            return float(cleaned)
-        except:
-            return 0.0
+            return _parse_amount(s)
+        except ValueError:
+            # Amounts wrapped across lines still carry newlines or other whitespace inside
+            try:
+                return float(_NON_NUMERIC_RE.sub('', s))
+            except ValueError:
+                return 0.0
 
     def _extract_axis_transactions(self, text: str) -> List[Dict]:
         transactions = []
         text = text.replace('\r', '').replace('\t', ' ')
-        text = re.sub(r' {2,}', ' ', text)
-        tx_pattern = re.compile(
-            r'(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([\d\s,]+\.\d{2})\s*(Dr|Cr)\b',
-            re.MULTILINE | re.IGNORECASE
-        )
-        for match in tx_pattern.finditer(text):
+        text = _MULTI_SPACE_RE.sub(' ', text)
+        for match in _AXIS_TX_RE.finditer(text):
             date, desc, amt_str, drcr = match.groups()
             amount = self._clean_amount_to_float(amt_str)
             if drcr.lower() == 'cr':
                 amount = -amount
             transactions.append({'date': date, 'description': desc.strip(), 'amount': amount})
+        # Rows wrapped onto their own line: the first amount on a line that doesn't open
+        # with a date belongs to the most recent date-led line
         last_date = None
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
+        line_end = -1
+        for match in _AXIS_LINE_SCAN_RE.finditer(text):
+            if match.start() < line_end:
                 continue
-            m_date = re.match(r'(\d{2}/\d{2}/\d{4})', line)
-            if m_date:
-                last_date = m_date.group(1)
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            line_end = text.find('\n', match.end())
+            if line_end == -1:
+                line_end = len(text)
+            if match.group('date'):
+                last_date = match.group('date')
                 continue
-            m_amount = re.search(r'([\d\s,]+\.\d{2})\s*(Dr|Cr)\b', line, re.IGNORECASE)
-            if m_amount and last_date:
-                amt = self._clean_amount_to_float(m_amount.group(1))
-                if m_amount.group(2).lower() == 'cr':
+            if last_date:
+                amt = self._clean_amount_to_float(match.group('amount'))
+                if match.group('drcr').lower() == 'cr':
                     amt = -amt
-                desc = re.sub(r'([\d\s,]+\.\d{2})\s*(Dr|Cr)\b', '', line).strip()
+                desc = _AXIS_AMOUNT_DRCR_STRIP_RE.sub('', text[line_start:line_end].strip()).strip()
                 if desc:
                     transactions.append({'date': last_date, 'description': desc, 'amount': amt})
-        seen = set()
-        unique = []
-        for tx in transactions:
-            key = (tx['date'], tx['description'][:30], tx['amount'])
-            if key not in seen:
-                seen.add(key)
-                unique.append(tx)
-        return unique
+        return self._dedup(transactions, lambda tx: _tx_key(tx, 30))
 
     # ========== IDFC FIRST PARSER ==========
     def _parse_idfc(self, text: str) -> CreditCardData:
         cardholder_name = self._extract_idfc_name(text)
         card_last_4 = self._extract_idfc_card_last_4(text)
-        statement_date, payment_due_date = self._extract_idfc_dates(text)
-        total_amount_due, minimum_amount_due = self._extract_idfc_dues(text)
-        credit_limit, available_credit, cash_limit = self._extract_idfc_limits(text)
-        transactions = self._extract_idfc_transactions(text)
+        # Labels are matched case-insensitively by lowercasing once; only digits are captured there
+        text_lower = text.lower()
+        statement_date, payment_due_date = self._extract_idfc_dates(text_lower)
+        total_amount_due, minimum_amount_due = self._extract_idfc_dues(text_lower)
+        credit_limit, available_credit, cash_limit = self._extract_idfc_limits(text, text_lower)
+        transactions = self._extract_idfc_transactions(text, text_lower)
 
         return CreditCardData(
             bank_name='IDFC First',
@@ -896,166 +1168,154 @@ class CreditCardParser:
         )
 
     def _extract_idfc_name(self, text: str) -> str:
-        match = re.search(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*\n\s*Credit Card Statement', text, re.MULTILINE)
+        match = _IDFC_NAME_HEADER_RE.search(text)
         if match:
             return match.group(1).strip()
-        match = re.search(r'Customer Name\s*:\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', text)
+        match = _IDFC_CUSTOMER_NAME_RE.search(text)
         if match:
             name = match.group(1).strip()
-            name = re.sub(r'\s+Card\s+Number.*$', '', name, flags=re.IGNORECASE)
+            name = _IDFC_CARD_NUMBER_TAIL_RE.sub('', name)
             return name
-        match = re.search(r'\n([A-Z][A-Za-z]+(?:\s+[A-Z][A-Za-z]+){1,3})\s*\n.*?Credit Card Statement', text, re.DOTALL)
+        match = _IDFC_NAME_BEFORE_STATEMENT_RE.search(text)
         if match:
             name = match.group(1).strip()
-            if not any(kw in name.upper() for kw in ['ALWAYS', 'FIRST', 'BANK', 'STATEMENT', 'CARD NUMBER']):
+            if not _IDFC_NAME_SKIP_RE.search(name.upper()):
                 return name
         return "Not Found"
 
     def _extract_idfc_card_last_4(self, text: str) -> str:
-        match = re.search(r'(\d{6}\*{6}(\d{4}))|(\*{6}(\d{4}))', text)
+        match = _STAR_CARD_RE.search(text)
         if match:
             for g in match.groups():
-                if g and re.fullmatch(r'\d{4}', g):
+                if g and _FOUR_DIGITS_RE.fullmatch(g):
                     return g
-        match = re.search(r'Card Number\s*:?\s*\d+\*+(\d{4})', text)
+        match = _IDFC_CARD_NUMBER_RE.search(text)
         if match:
             return match.group(1)
         return "Not Found"
 
-    def _extract_idfc_dates(self, text: str) -> tuple:
-        match = re.search(r'Statement\s+Date\s*\n\s*(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})', text, re.IGNORECASE)
+    def _extract_idfc_dates(self, text_lower: str) -> tuple:
+        match = _IDFC_DATES_RE.search(text_lower)
         if match:
             return match.group(1), match.group(2)
-        stmt_match = re.search(r'Statement\s+Date\s*\n\s*(\d{2}/\d{2}/\d{4})', text, re.IGNORECASE)
-        due_match = re.search(r'Payment\s+Due\s+Date\s*\n\s*(\d{2}/\d{2}/\d{4})', text, re.IGNORECASE)
-        s_date = stmt_match.group(1) if stmt_match else "Not Found"
-        d_date = due_match.group(1) if due_match else "Not Found"
+        dates = _first_of_each(_IDFC_LABELLED_DATES_RE, text_lower)
+        s_date = dates.get('statement', "Not Found")
+        d_date = dates.get('due', "Not Found")
         if s_date != "Not Found" or d_date != "Not Found":
             return s_date, d_date
-        match = re.search(r'(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})', text)
+        match = _DATE_PAIR_RE.search(text_lower)
         if match:
             return match.group(1), match.group(2)
         return "Not Found", "Not Found"
 
-    def _extract_idfc_dues(self, text: str) -> tuple:
-        match = re.search(
-            r'Total\s+Amount\s+Due\s+Minimum\s+Amount\s+Due\s*\n\s*r?\s*([\d,]+\.?\d*)\s+r?\s*([\d,]+\.?\d*)',
-            text, re.IGNORECASE
-        )
+    def _extract_idfc_dues(self, text_lower: str) -> tuple:
+        # Every dues pattern is labelled "... amount due"
+        if 'amount' not in text_lower:
+            return 0.0, 0.0
+        match = _IDFC_DUES_TABLE_RE.search(text_lower)
         if match:
             try:
-                total = float(match.group(1).replace(',', ''))
-                minimum = float(match.group(2).replace(',', ''))
+                total = _parse_amount(match.group(1))
+                minimum = _parse_amount(match.group(2))
                 return total, minimum
             except ValueError:
                 pass
-        match = re.search(
-            r'Total\s+Amount\s+Due.*?Minimum\s+Amount\s+Due.*?\n.*?[r₹]\s*([\d,]+\.?\d*).*?[r₹]\s*([\d,]+\.?\d*)',
-            text, re.IGNORECASE | re.DOTALL
-        )
+        match = None
+        total_label = _IDFC_TOTAL_DUE_LABEL_RE.search(text_lower)
+        min_label = total_label and _IDFC_MIN_DUE_LABEL_RE.search(text_lower, total_label.end())
+        if min_label:
+            window_start = min_label.end()
+            match = _IDFC_DUES_WINDOW_RE.match(text_lower, window_start, window_start + _IDFC_DUES_WINDOW)
         if match:
             try:
-                total = float(match.group(1).replace(',', ''))
-                minimum = float(match.group(2).replace(',', ''))
+                total = _parse_amount(match.group(1))
+                minimum = _parse_amount(match.group(2))
                 return total, minimum
             except ValueError:
                 pass
         total = 0.0
         minimum = 0.0
-        total_match = re.search(r'Total\s+Amount\s+Due\s*:?\s*[r₹]?\s*([\d,]+\.?\d*)', text, re.IGNORECASE)
-        if total_match:
+        dues = _first_of_each(_IDFC_LABELLED_DUES_RE, text_lower)
+        if 'total' in dues:
             try:
-                total = float(total_match.group(1).replace(',', ''))
+                total = _parse_amount(dues['total'])
             except ValueError:
                 pass
-        min_match = re.search(r'Minimum\s+Amount\s+Due\s*:?\s*[r₹]?\s*([\d,]+\.?\d*)', text, re.IGNORECASE)
-        if min_match:
+        if 'minimum' in dues:
             try:
-                minimum = float(min_match.group(1).replace(',', ''))
+                minimum = _parse_amount(dues['minimum'])
             except ValueError:
                 pass
         if total > 0 or minimum > 0:
             return total, minimum
         return 0.0, 0.0
 
-    def _extract_idfc_limits(self, text: str) -> tuple:
+    def _extract_idfc_limits(self, text: str, text_lower: str) -> tuple:
+        # Every limits pattern and label ends in "limit"
+        if 'limit' not in text_lower:
+            return 0.0, 0.0, 0.0
         credit = 0.0
         available = 0.0
         cash = 0.0
-        limits_block = re.search(
-            r'Credit\s+Limit\s+Available\s+Credit\s+Limit.*?Cash\s+Limit',
-            text, re.IGNORECASE | re.DOTALL
-        )
+        limits_block = _IDFC_LIMITS_BLOCK_RE.search(text_lower)
         if limits_block:
             block_text = limits_block.group(0)
-            amounts = re.findall(r'r\s*([\d,]+(?:\.\d+)?)', block_text, re.IGNORECASE)
+            amounts = _IDFC_RUPEE_AMOUNT_RE.findall(block_text)
             if len(amounts) >= 3:
                 try:
-                    credit = float(amounts[0].replace(',', ''))
-                    available = float(amounts[1].replace(',', ''))
-                    cash = float(amounts[2].replace(',', ''))
+                    credit = _parse_amount(amounts[0])
+                    available = _parse_amount(amounts[1])
+                    cash = _parse_amount(amounts[2])
                     return credit, available, cash
                 except (ValueError, IndexError):
                     pass
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            if 'Credit Limit' in line and 'Available Credit Limit' in line and i + 1 < len(lines):
-                next_line = lines[i + 1]
-                nums = re.findall(r'r?\s*([\d,]+(?:\.\d+)?)', next_line)
-                if len(nums) >= 2:
-                    try:
-                        credit = float(nums[0].replace(',', ''))
-                        available = float(nums[1].replace(',', ''))
-                    except ValueError:
-                        pass
-            if 'Cash Limit' in line and i + 1 < len(lines):
-                next_line = lines[i + 1]
-                nums = re.findall(r'r?\s*([\d,]+(?:\.\d+)?)', next_line)
-                if nums:
-                    try:
-                        cash = float(nums[0].replace(',', ''))
-                    except ValueError:
-                        pass
+        # Values sit on the line below their labels; the last labelled line wins
+        for next_line in _lines_after(text, 'Available Credit Limit'):
+            nums = _IDFC_LINE_AMOUNT_RE.findall(next_line)
+            if len(nums) >= 2:
+                try:
+                    credit = _parse_amount(nums[0])
+                    available = _parse_amount(nums[1])
+                except ValueError:
+                    pass
+        for next_line in _lines_after(text, 'Cash Limit'):
+            nums = _IDFC_LINE_AMOUNT_RE.findall(next_line)
+            if nums:
+                try:
+                    cash = _parse_amount(nums[0])
+                except ValueError:
+                    pass
         if credit == 0.0:
-            credit_section = re.search(
-                r'Credit\s+Limit.*?(?:Available|Cash|\n\n)',
-                text, re.IGNORECASE | re.DOTALL
-            )
+            credit_section = _IDFC_CREDIT_SECTION_RE.search(text_lower)
             if credit_section:
-                nums = re.findall(r'(?:r|₹)?\s*([\d,]+(?:\.\d+)?)', credit_section.group(0))
+                nums = _IDFC_SECTION_AMOUNT_RE.findall(credit_section.group(0))
                 for n in nums:
                     try:
-                        val = float(n.replace(',', ''))
+                        val = _parse_amount(n)
                         if 10000 <= val <= 10000000:
                             credit = val
                             break
                     except ValueError:
                         continue
         if available == 0.0:
-            avail_section = re.search(
-                r'Available\s+Credit\s+Limit.*?(?:Cash|\n\n)',
-                text, re.IGNORECASE | re.DOTALL
-            )
+            avail_section = _IDFC_AVAIL_SECTION_RE.search(text_lower)
             if avail_section:
-                nums = re.findall(r'(?:r|₹)?\s*([\d,]+(?:\.\d+)?)', avail_section.group(0))
+                nums = _IDFC_SECTION_AMOUNT_RE.findall(avail_section.group(0))
                 for n in nums:
                     try:
-                        val = float(n.replace(',', ''))
+                        val = _parse_amount(n)
                         if 0 < val <= 10000000:
                             available = val
                             break
                     except ValueError:
                         continue
         if cash == 0.0:
-            cash_section = re.search(
-                r'Cash\s+Limit.*?(?:\n\n|STATEMENT)',
-                text, re.IGNORECASE | re.DOTALL
-            )
+            cash_section = _IDFC_CASH_SECTION_RE.search(text_lower)
             if cash_section:
-                nums = re.findall(r'(?:r|₹)?\s*([\d,]+(?:\.\d+)?)', cash_section.group(0))
+                nums = _IDFC_SECTION_AMOUNT_RE.findall(cash_section.group(0))
                 for n in nums:
                     try:
-                        val = float(n.replace(',', ''))
+                        val = _parse_amount(n)
                         if 1000 <= val <= 1000000:
                             cash = val
                             break
@@ -1063,38 +1323,36 @@ class CreditCardParser:
                         continue
         return credit, available, cash
 
-    def _extract_idfc_transactions(self, text: str) -> List[Dict]:
+    def _extract_idfc_transactions(self, text: str, text_lower: str) -> List[Dict]:
         transactions = []
-        tx_section_match = re.search(r'YOUR\s+TRANSACTIONS.*?(?=KEY\s+OFFERS|Page\s+\d+|$)', text, re.IGNORECASE | re.DOTALL)
-        if not tx_section_match:
+        if 'transactions' not in text_lower:
             return transactions
-        tx_text = tx_section_match.group(0)
-        tx_pattern = re.compile(
-            r'(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s*(CR)?(?:\s*\n|$)',
-            re.MULTILINE | re.IGNORECASE
-        )
-        for match in tx_pattern.finditer(tx_text):
+        header = _IDFC_TX_HEADER_RE.search(text)
+        if not header:
+            return transactions
+        end = _IDFC_TX_END_RE.search(text, header.end())
+        if end:
+            section_end = end.start()
+        elif text.endswith('\n'):
+            section_end = max(len(text) - 1, header.end())
+        else:
+            section_end = len(text)
+        tx_text = text[header.start():section_end]
+        for match in _IDFC_TX_RE.finditer(tx_text):
             date = match.group(1)
             desc = match.group(2).strip()
             amt_str = match.group(3)
             is_credit = match.group(4) is not None
-            if any(kw in desc.upper() for kw in ['TRANSACTION', 'DATE', 'DETAILS', 'AMOUNT', 'CUSTOMER NAME', 'CARD NUMBER']):
+            if _IDFC_SKIP_RE.search(desc.upper()):
                 continue
             try:
-                amt = float(amt_str.replace(',', ''))
+                amt = _parse_amount(amt_str)
                 if is_credit:
                     amt = -amt
                 transactions.append({'date': date, 'description': desc, 'amount': amt})
             except ValueError:
                 continue
-        seen = set()
-        unique_transactions = []
-        for tx in transactions:
-            key = (tx['date'], tx['description'][:30], tx['amount'])
-            if key not in seen:
-                seen.add(key)
-                unique_transactions.append(tx)
-        return unique_transactions
+        return self._dedup(transactions, lambda tx: _tx_key(tx, 30))
 
     # ========== INDIAN BANK PARSER ==========
     def _parse_indian_bank(self, text: str) -> CreditCardData:
@@ -1119,25 +1377,26 @@ class CreditCardParser:
         )
 
     def _extract_indian_name(self, text: str) -> str:
-        match = re.search(r'Mr\.?\s+([A-Z][A-Za-z\s]+)', text)
+        match = _INDIAN_NAME_RE.search(text)
         if match:
             return match.group(1).strip()
-        for line in text.splitlines():
-            if line.strip().isupper() and len(line.strip().split()) >= 2:
-                return line.strip()
+        for line_match in _LINE_RE.finditer(text):
+            line = line_match.group(0).strip()
+            if line.isupper() and len(line.split()) >= 2:
+                return line
         return "Not Found"
 
     def _extract_indian_card_last_4(self, text: str) -> str:
-        match = re.search(r'(\d{4})\s*\d{2}XX\s*XXXX\s*(\d{4})', text)
+        match = _INDIAN_CARD_RE.search(text)
         if match:
             return match.group(2)
-        match = re.search(r'XXXX\s*(\d{4})', text)
+        match = _INDIAN_CARD_TAIL_RE.search(text)
         if match:
             return match.group(1)
         return "Not Found"
 
     def _extract_indian_dates(self, text: str) -> tuple:
-        match = re.search(r'(\d{2}-\d{2}-\d{2})\s+(\d{2}-\d{2}-\d{2})\s*-\s*(\d{2}-\d{2}-\d{2})\s+(\d{2}-\d{2}-\d{2})', text)
+        match = _INDIAN_DATES_RE.search(text)
         if match:
             statement_date = match.group(1)
             statement_period = f"{match.group(2)} - {match.group(3)}"
@@ -1146,33 +1405,33 @@ class CreditCardParser:
         return "Not Found", "Not Found", "Not Found"
 
     def _extract_indian_dues(self, text: str) -> tuple:
-        pattern_primary = r'\d{4}\s+\d{2}XX\s+XXXX\s+\d{4}.*?\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})'
-        match = re.search(pattern_primary, text)
+        match = _INDIAN_DUES_RE.search(text)
         if match:
             try:
-                total = float(match.group(1).replace(',', ''))
-                minimum = float(match.group(2).replace(',', ''))
+                total = _parse_amount(match.group(1))
+                minimum = _parse_amount(match.group(2))
                 return total, minimum
             except ValueError:
                 pass
-        matches = re.findall(r'([\d,]+\.\d{2})\s+([\d,]+\.\d{2})', text)
-        if matches:
-            last_pair = matches[-1]
+        last_pair = None
+        for last_pair in _AMOUNT_PAIR_RE.finditer(text):
+            pass
+        if last_pair:
             try:
-                total = float(last_pair[0].replace(',', ''))
-                minimum = float(last_pair[1].replace(',', ''))
+                total = _parse_amount(last_pair.group(1))
+                minimum = _parse_amount(last_pair.group(2))
                 return total, minimum
             except ValueError:
                 pass
         return 0.0, 0.0
 
     def _extract_indian_limits(self, text: str) -> tuple:
-        match = re.search(r'([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})', text)
+        match = _INDIAN_LIMITS_RE.search(text)
         if match:
             try:
-                credit_limit = float(match.group(1).replace(',', ''))
-                available_credit = float(match.group(2).replace(',', ''))
-                cash_limit = float(match.group(3).replace(',', ''))
+                credit_limit = _parse_amount(match.group(1))
+                available_credit = _parse_amount(match.group(2))
+                cash_limit = _parse_amount(match.group(3))
                 return credit_limit, available_credit, cash_limit
             except ValueError:
                 pass
@@ -1180,24 +1439,22 @@ class CreditCardParser:
 
     def _extract_indian_transactions(self, text: str) -> List[Dict]:
         transactions = []
-        match = re.search(r'Txn\.\s*Date\s*Transaction Particulars.*?(?=CONTACT|Mr\.|Page|\Z)', text, re.DOTALL | re.IGNORECASE)
+        match = _INDIAN_TX_SECTION_RE.search(text)
         if not match:
             # fallback: try to find lines that look like DD-MMM-YY followed by description and amount
-            tx_lines = re.findall(r'(\d{2}-[A-Z]{3}-\d{2})\s+(.+?)\s+(Cr|Dr)\s+([\d,]+\.\d{2})', text, re.IGNORECASE)
-            for m in tx_lines:
-                date, desc, crdr, amount_str = m
-                amt = float(amount_str.replace(',', ''))
+            for m in _INDIAN_TX_RE.finditer(text):
+                date, desc, crdr, amount_str = m.groups()
+                amt = _parse_amount(amount_str)
                 if crdr.lower() == 'cr':
                     amt = -amt
                 transactions.append({'date': date, 'description': desc.strip(), 'amount': amt})
             return transactions
         tx_text = match.group(0)
-        tx_pattern = re.compile(r'(\d{2}-[A-Z]{3}-\d{2})\s+(.+?)\s+(Cr|Dr)\s+([\d,]+\.\d{2})', re.IGNORECASE)
-        for m in tx_pattern.finditer(tx_text):
+        for m in _INDIAN_TX_RE.finditer(tx_text):
             date = m.group(1)
             desc = m.group(2).strip()
             crdr = m.group(3).strip().lower()
-            amount = float(m.group(4).replace(',', ''))
+            amount = _parse_amount(m.group(4))
             if crdr == 'cr':
                 amount = -amount
             transactions.append({'date': date, 'description': desc, 'amount': amount})
@@ -1219,6 +1476,45 @@ class CreditCardParser:
         )
 
 
+def _init_worker():
+    """Keep Tesseract single-threaded in batch workers, whose parsers already OCR pages on threads"""
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+
+@lru_cache(maxsize=1)
+def _worker_parser(ocr_workers: int) -> CreditCardParser:
+    """One parser per worker process, reused for every file that worker is handed"""
+    return CreditCardParser(enable_ocr=True, ocr_workers=ocr_workers)
+
+
+def _parse_one(pdf_path: str, password: Union[str, None] = None, ocr_workers: int = 1) -> tuple:
+    """
+    Worker entry for parse_many. Workers have no stdin, so encrypted PDFs never prompt,
+    and any failure is returned as a message so it can't abort the rest of the batch.
+    """
+    try:
+        return pdf_path, _worker_parser(ocr_workers).parse_statement(pdf_path, password, interactive=False), None
+    except Exception as e:
+        return pdf_path, None, f"{type(e).__name__}: {e}"
+
+
+def parse_many(pdf_paths: List[str], workers: Union[int, None] = None,
+               password: Union[str, None] = None) -> Iterator[tuple]:
+    """
+    Parse several statements across CPU cores, yielding (pdf_path, data, error) in input order.
+    data is None and error describes the failure when a file couldn't be parsed.
+    Statements are independent, so each worker process parses its share with its own parser.
+    """
+    pdf_paths = list(pdf_paths)
+    cpus = os.cpu_count() or 1
+    # Split the CPUs between the processes so OCR threads don't multiply past the core count
+    ocr_workers = max(1, cpus // (workers or cpus))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        yield from executor.map(
+            _parse_one, pdf_paths, [password] * len(pdf_paths), [ocr_workers] * len(pdf_paths), chunksize=4
+        )
+
+
 class StatementAnalyzer:
     """Analyze and display parsed statement data"""
 
@@ -1242,11 +1538,17 @@ class StatementAnalyzer:
 
 def main():
     """Standalone parser for VS Code"""
-    import pandas as pd
+    import argparse
     import os
     import traceback
     import sys
 
+    arg_parser = argparse.ArgumentParser(description="Credit card statement parser")
+    arg_parser.add_argument('--batch', metavar='DIR', help="parse every PDF in DIR across all CPU cores")
+    arg_parser.add_argument('--workers', type=int, default=None, help="worker processes for --batch")
+    arg_parser.add_argument('--password', default=None, help="password for encrypted PDFs in --batch")
+    args = arg_parser.parse_args()
+
     parser = CreditCardParser(enable_ocr=True)
     analyzer = StatementAnalyzer()
 
@@ -1255,11 +1557,31 @@ def main():
     print("🏦 Supported Banks: HDFC, ICICI, Axis, IDFC First, Indian Bank")
     
     if OCR_AVAILABLE:
-        print("🔍 OCR: Enabled (pytesseract available)")
+        print(f"🔍 OCR: Enabled ({'tesserocr' if TESSEROCR_AVAILABLE else 'pytesseract'} available)")
     else:
-        print("⚠️  OCR: Disabled (install pytesseract and pillow for scanned PDFs)")
+        print("⚠️  OCR: Disabled (install pillow with tesserocr or pytesseract for scanned PDFs)")
     
     print("=" * 60)
+
+    if args.batch:
+        pdf_paths = sorted(
+            os.path.join(args.batch, name) for name in os.listdir(args.batch) if name.lower().endswith('.pdf')
+        )
+        print(f"📂 Batch: {len(pdf_paths)} PDFs in {args.batch}")
+        failed = 0
+        for pdf_path, data, error in parse_many(pdf_paths, workers=args.workers, password=args.password):
+            print(f"\n🔍 {pdf_path}")
+            if error:
+                print(f"❌ Failed: {error}")
+                failed += 1
+            elif data.bank_name == 'CORRUPT':
+                print("❌ Failed: corrupt PDF")
+                failed += 1
+            else:
+                analyzer.display_summary(data)
+        print(f"\n✅ Parsed {len(pdf_paths) - failed} of {len(pdf_paths)} PDFs ({failed} failed)")
+        return
+
     pdf_path = input("📂 Enter the full path to your PDF: ").strip()
 
     if not os.path.exists(pdf_path):
@@ -1282,28 +1604,27 @@ def main():
             print("TRANSACTIONS:")
             print("=" * 60)
 
-            df = pd.DataFrame(data.transactions)
-
             # Format amount nicely
-            df["amount_str"] = df["amount"].apply(
-                lambda x: f"₹{x:,.2f}" if x >= 0 else f"-₹{abs(x):,.2f}"
-            )
+            amount_strs = [
+                f"₹{t['amount']:,.2f}" if t['amount'] >= 0 else f"-₹{-t['amount']:,.2f}"
+                for t in data.transactions
+            ]
 
             # Calculate column widths dynamically
-            date_width = max(df["date"].map(len).max(), len("Date"))
-            desc_width = max(df["description"].map(len).max(), len("Description"))
-            amt_width = max(df["amount_str"].map(len).max(), len("Amount"))
+            date_width = max(max(len(t['date']) for t in data.transactions), len("Date"))
+            desc_width = max(max(len(t['description']) for t in data.transactions), len("Description"))
+            amt_width = max(max(map(len, amount_strs)), len("Amount"))
 
             # Print header
             print(f"{'Date':<{date_width}}  {'Description':<{desc_width}}  {'Amount':>{amt_width}}")
             print("-" * (date_width + desc_width + amt_width + 4))
 
             # Print each transaction
-            for _, row in df.iterrows():
+            for t, amount_str in zip(data.transactions, amount_strs):
                 print(
-                    f"{row['date']:<{date_width}}  "
-                    f"{row['description']:<{desc_width}}  "
-                    f"{row['amount_str']:>{amt_width}}"
+                    f"{t['date']:<{date_width}}  "
+                    f"{t['description']:<{desc_width}}  "
+                    f"{amount_str:>{amt_width}}"
                 )
 
         else: